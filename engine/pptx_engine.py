@@ -6,7 +6,8 @@ Builds Interactive Lecture presentations using a HYBRID approach:
 1. Opens the real template PPTX as the base (gets backgrounds, headers, footers, logos)
 2. Deletes the template's example slides
 3. Adds new slides using the template's own layouts (Layout 0 = title, Layout 1 = content)
-4. Places content using add_textbox() / add_picture() — NEVER touches placeholder shapes
+4. Places content as new shapes serialized from the module's XML templates
+   (_TEXTBOX_XML, _AUTOSHAPE_XML, _PICTURE_XML) — NEVER touches placeholder shapes
 
 Template: "قالب المحاضرة التفاعلية- عربي.pptx"
 
@@ -18,8 +19,11 @@ Design specs from the template:
 
 CRITICAL RULES:
 - NEVER modify placeholder shapes (causes overlapping text)
-- ALWAYS use slide.shapes.add_textbox() for text
-- ALWAYS use slide.shapes.add_picture() for images
+- ALWAYS add text, autoshapes and images as new shapes built from the XML
+  templates (_textbox_xml() / _autoshape_xml() / _picture_xml()) and
+  attached with _append_shapes_xml()
+- ALWAYS take shape ids from _next_shape_id(slide), numbering a batch
+  upwards from it — never hard-code or reuse an id
 
 Usage:
     from engine.pptx_engine import LectureBuilder
@@ -36,26 +40,37 @@ Usage:
     builder.save("output/DSAI/U01/DSAI_U01_Interactive_Lecture.pptx")
 """
 
+import io
 import os
+import zipfile
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
+from xml.sax.saxutils import escape
 
 from PIL import Image as PILImage  # For reading image dimensions (aspect ratio)
+from lxml import etree
 
 from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, nsuri
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml.slide import CT_NotesSlide
+from pptx.parts.slide import NotesSlidePart
+from pptx.oxml.text import CT_RegularTextRun
+from pptx.shapes.autoshape import AutoShapeType
+from pptx.shapes.shapetree import SlideShapeFactory
 from pptx.util import Inches, Pt, Cm, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.enum.dml import MSO_LINE_DASH_STYLE
 
 # Shared RTL helpers — critical workarounds for Arabic text in python-pptx.
 # These functions handle XML-level operations that python-pptx doesn't
 # expose natively (paragraph RTL direction, complex script font assignment).
 from engine.rtl_helpers import (
-    pptx_set_paragraph_rtl,
     pptx_set_paragraph_ltr,
-    pptx_set_run_font_arabic,
 )
 
 # Image generation — auto-generates images when agent provides a prompt
@@ -116,6 +131,53 @@ ACCENT_EXAMPLE = RGBColor(0xFF, 0x98, 0x00)          # Orange for examples
 # Header bar color — a slightly darker blue for the top banner
 HEADER_BAR_BLUE = RGBColor(0x2D, 0x58, 0x8C)
 
+# Utility colors used inside slide builders — declared once here so the
+# builders don't construct (and validate) a new RGBColor on every call
+PLACEHOLDER_BG = RGBColor(0xE0, 0xE0, 0xE0)          # Gray image placeholder fill
+PLACEHOLDER_BORDER = RGBColor(0xBD, 0xBD, 0xBD)      # Gray image placeholder border
+DOT_INACTIVE = RGBColor(0x80, 0x9F, 0xBF)            # Inactive section progress dot
+CARD_DARK2 = RGBColor(0x0E, 0x28, 0x41)              # Dark navy from template theme
+AMBER = RGBColor(0xFF, 0x8F, 0x00)                   # Amber accent
+
+# Card colors cycled by add_content_with_cards() — extended palette for
+# 4+ cards, includes TEAL and AMBER for variety
+_DEFAULT_CARD_COLORS = (PRIMARY_BLUE, ACCENT1_BLUE, TEAL, CARD_DARK2, AMBER, PRIMARY_BLUE)
+
+# Quiz option labels: Arabic letter badges (أ ب ج د) and the matching
+# Storyline shape-name suffixes (opt_a … opt_d) — see _option_labels()
+_ARABIC_LETTERS = ("أ", "ب", "ج", "د")
+_OPT_IDS = ("a", "b", "c", "d")
+
+# Storyline import instructions written to the notes of quiz and
+# drag-and-drop slides, filled in with a single str.format() per slide
+_QUIZ_NOTES_TMPL = (
+    "=== STORYLINE INSTRUCTIONS ===\n"
+    "Slide Type: Quiz - Multiple Choice\n"
+    "Correct Answer: {letter} (opt_{opt_id})\n"
+    "Feedback (Correct): احسنت! الاجابة صحيحة\n"
+    "Feedback (Incorrect): الاجابة غير صحيحة، حاول مرة اخرى\n"
+    "Points: 10\n"
+    "Attempts: 2\n\n"
+    "=== FREEFORM SETUP ===\n"
+    "1. Insert > Convert to Freeform > Pick One\n"
+    "2. Assign opt_a, opt_b, opt_c, opt_d as choices\n"
+    "3. Set opt_{opt_id} as correct answer\n"
+    "4. btn_check triggers submit\n\n"
+    "=== NARRATOR SCRIPT ===\n"
+    "{question}"
+)
+_DRAG_DROP_NOTES_TMPL = (
+    "=== STORYLINE INSTRUCTIONS ===\n"
+    "Slide Type: Drag and Drop - Ordering\n"
+    "Correct Order:\n{mapping_lines}\n\n"
+    "=== FREEFORM SETUP ===\n"
+    "1. Insert > Convert to Freeform > Drag and Drop\n"
+    "2. Match drag_item shapes to drop_zone shapes\n"
+    "3. Set correct order as shown above\n\n"
+    "=== NARRATOR SCRIPT ===\n"
+    "{question}"
+)
+
 # PNG asset file names (extracted from the template)
 ASSET_BANNER_NARROW = "banner_narrow.png"   # Section banner (objectives, content slides)
 ASSET_BANNER_WIDE = "banner_wide.png"       # Activity/summary banner (wider)
@@ -184,6 +246,436 @@ CONTENT_HEIGHT = 4000000    # ~11.1cm tall
 TEXT_MARGIN_LR = Cm(0.25)
 TEXT_MARGIN_TB = Cm(0.13)
 
+# Default template location, used when no (existing) template_path is
+# passed to LectureBuilder — resolved once at import
+_DEFAULT_TPL_PATH = os.path.join(
+    os.path.expanduser("~"),
+    "Downloads",
+    "storyboard template",
+    "قالب المحاضرة التفاعلية- عربي.pptx",
+)
+
+# Fast-save mode — call save_fast(), or set STORYBOARD_FAST_SAVE=1 to make
+# save() do so, to write decks with zlib level 1 instead of python-pptx's
+# default (level 6). Saving is roughly
+# 2-3x faster for slide-heavy decks at the cost of ~10-20% larger files,
+# which is the right trade-off for iterative/preview builds.
+FAST_SAVE_ENV = "STORYBOARD_FAST_SAVE"
+FAST_SAVE_COMPRESSLEVEL = 1
+
+# Part extensions whose blobs are already compressed — fast save stores
+# them as-is instead of running them through zlib again
+_STORED_PART_EXTS = frozenset(("png", "jpg", "jpeg", "gif", "emf", "wdp"))
+
+# Fast save drives these python-pptx internals directly (tested against
+# python-pptx 1.0.x, which the repo does not pin). If an upgrade moves or
+# renames any of them, _save_fast() falls back to a normal prs.save().
+try:
+    from pptx.opc.serialized import PackageWriter
+except ImportError:
+    PackageWriter = None
+_PACKAGE_WRITER_INTERNALS = ("_write_content_types_stream", "_write_pkg_rels", "_write_parts")
+_FAST_SAVE_SUPPORTED = PackageWriter is not None and all(
+    hasattr(PackageWriter, attr) for attr in _PACKAGE_WRITER_INTERNALS
+)
+
+# Common geometry (EMU) — Cm()/Pt() literals used by the slide builders,
+# precomputed once at import so builders load plain ints instead of
+# re-running the unit conversion on every call. Named CM_<cm> / PT_<pt>
+# with "_" for the decimal point (CM_2_5 == Cm(2.5)).
+CM_0_08 = Cm(0.08)
+CM_0_1 = Cm(0.1)
+CM_0_15 = Cm(0.15)
+CM_0_2 = Cm(0.2)
+CM_0_3 = Cm(0.3)
+CM_0_4 = Cm(0.4)
+CM_0_5 = Cm(0.5)
+CM_0_6 = Cm(0.6)
+CM_0_8 = Cm(0.8)
+CM_1 = Cm(1)
+CM_1_2 = Cm(1.2)
+CM_1_5 = Cm(1.5)
+CM_1_6 = Cm(1.6)
+CM_1_7 = Cm(1.7)
+CM_1_8 = Cm(1.8)
+CM_2 = Cm(2)
+CM_2_2 = Cm(2.2)
+CM_2_5 = Cm(2.5)
+CM_3 = Cm(3)
+CM_3_5 = Cm(3.5)
+CM_4 = Cm(4)
+CM_4_2 = Cm(4.2)
+CM_4_5 = Cm(4.5)
+CM_4_8 = Cm(4.8)
+CM_5 = Cm(5)
+CM_5_5 = Cm(5.5)
+CM_6 = Cm(6)
+CM_6_5 = Cm(6.5)
+CM_7 = Cm(7)
+CM_7_5 = Cm(7.5)
+CM_8 = Cm(8)
+CM_8_5 = Cm(8.5)
+CM_8_7 = Cm(8.7)
+CM_9 = Cm(9)
+CM_9_3 = Cm(9.3)
+CM_10 = Cm(10)
+CM_10_5 = Cm(10.5)
+CM_11 = Cm(11)
+CM_11_5 = Cm(11.5)
+CM_12 = Cm(12)
+CM_13 = Cm(13)
+CM_13_5 = Cm(13.5)
+CM_14 = Cm(14)
+CM_15 = Cm(15)
+CM_16 = Cm(16)
+CM_17 = Cm(17)
+CM_18 = Cm(18)
+CM_21 = Cm(21)
+CM_22 = Cm(22)
+CM_24 = Cm(24)
+CM_24_5 = Cm(24.5)
+CM_26 = Cm(26)
+CM_27_5 = Cm(27.5)
+CM_28 = Cm(28)
+CM_28_5 = Cm(28.5)
+CM_29 = Cm(29)
+CM_30 = Cm(30)
+CM_30_5 = Cm(30.5)
+CM_31 = Cm(31)
+PT_0_5 = Pt(0.5)
+PT_1 = Pt(1)
+PT_1_5 = Pt(1.5)
+PT_2 = Pt(2)
+PT_8 = Pt(8)
+PT_12 = Pt(12)
+PT_14 = Pt(14)
+PT_16 = Pt(16)
+PT_18 = Pt(18)
+PT_20 = Pt(20)
+PT_22 = Pt(22)
+PT_24 = Pt(24)
+PT_36 = Pt(36)
+PT_40 = Pt(40)
+
+# Section banner variants for _section_banner_xml(), keyed by `wide`:
+# (banner left, top, width, height, text left, top, width, height,
+#  asset file, title font size)
+_SECTION_BANNERS = {
+    True: (
+        WIDE_BANNER_LEFT, WIDE_BANNER_TOP, WIDE_BANNER_WIDTH, WIDE_BANNER_HEIGHT,
+        WIDE_BANNER_TEXT_LEFT, WIDE_BANNER_TEXT_TOP,
+        WIDE_BANNER_TEXT_WIDTH, WIDE_BANNER_TEXT_HEIGHT,
+        ASSET_BANNER_WIDE, PT_20,
+    ),
+    False: (
+        BANNER_LEFT, BANNER_TOP, BANNER_WIDTH, BANNER_HEIGHT,
+        NARROW_BANNER_TEXT_LEFT, NARROW_BANNER_TEXT_TOP,
+        NARROW_BANNER_TEXT_WIDTH, NARROW_BANNER_TEXT_HEIGHT,
+        ASSET_BANNER_NARROW, PT_18,
+    ),
+}
+
+
+# Namespace URIs resolved once from python-pptx's own prefix map
+# DrawingML namespace — used when building text XML directly
+_A_NS = nsuri("a")
+
+# PresentationML namespace — used when building <p:sp> shape XML directly
+_P_NS = nsuri("p")
+
+# Relationships namespace — r:embed on hand-built <p:pic> elements
+_R_NS = nsuri("r")
+
+# Namespace declarations for the wrapper element batched shape fragments
+# are parsed under, so the prefixes are bound once per batch (one parse
+# per slide) rather than declared on every fragment
+_SHAPES_NSDECLS = nsdecls("p", "a", "r")
+
+# Every numeric id="..." in a slide's XML — the ids a new shape must avoid
+# (same scan python-pptx's own next-shape-id lookup does)
+_SLIDE_IDS_XPATH = etree.XPath("//@id")
+
+# Partname template/prefix for notes slides — see _notes_slide()
+_NOTES_SLIDE_PARTNAME = "/ppt/notesSlides/notesSlide%d.xml"
+_NOTES_SLIDE_PREFIX = "/ppt/notesSlides/notesSlide"
+
+# Theme style block python-pptx writes on every autoshape (add_shape());
+# hand-built shapes carry the same one so they render identically
+_AUTOSHAPE_STYLE_XML = (
+    '<p:style>'
+    '<a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef>'
+    '</p:style>'
+)
+
+# <a:bodyPr> autofit child for each MSO_AUTO_SIZE value
+_AUTOFIT_XML = {
+    None: "",
+    MSO_AUTO_SIZE.NONE: "<a:noAutofit/>",
+    MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT: "<a:spAutoFit/>",
+    MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE: "<a:normAutofit/>",
+}
+
+# Pre-serialized shape pieces for the batched builders (_autoshape_xml(),
+# _textbox_xml()). Structure is frozen here; per-shape geometry, colors and
+# text are filled in with one str.format() each.
+_RPR_XML = (
+    '<a:rPr sz="{size}" b="{bold}" lang="ar-JO">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+    '<a:cs typeface="{font}"/><a:latin typeface="{font}"/><a:ea typeface="{font}"/>'
+    '</a:rPr>'
+)
+_RUN_XML = '<a:r>{rPr}<a:t>{text}</a:t></a:r>'
+_LINE_SPACING_PPR_XML = (
+    '<a:pPr{algn}{rtl}><a:lnSpc><a:spcPct val="{spacing}"/></a:lnSpc></a:pPr>'
+)
+_PPR_XML = '<a:pPr{algn}{rtl}/>'
+_BADGE_TXBODY_XML = (
+    f'<p:txBody xmlns:p="{_P_NS}" xmlns:a="{_A_NS}">'
+    '<a:bodyPr rtlCol="0" anchor="ctr"{wrap}/><a:lstStyle/>'
+    '{paragraph}</p:txBody>'
+)
+_PICTURE_XML = (
+    '<p:pic><p:nvPicPr><p:cNvPr id="{id}" name="{name}" descr="{descr}"/>'
+    '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+    '<p:blipFill><a:blip r:embed="{rId}"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>'
+)
+# Default-name stem and <a:prstGeom> for the preset shapes the builders
+# draw — looked up directly instead of resolving MSO_SHAPE via
+# AutoShapeType on every shape (other presets still fall back to it)
+_PRESET_SHAPES = {
+    shape_type: (
+        AutoShapeType(shape_type).basename,
+        f'<a:prstGeom prst="{AutoShapeType(shape_type).prst}"><a:avLst/></a:prstGeom>',
+    )
+    for shape_type in (MSO_SHAPE.ROUNDED_RECTANGLE, MSO_SHAPE.RECTANGLE, MSO_SHAPE.OVAL)
+}
+_EMPTY_SHAPE_PARAGRAPH_XML = '<a:p><a:pPr algn="ctr"/></a:p>'
+_ROUND_RECT_ADJ_GEOM_XML = (
+    '<a:prstGeom prst="roundRect"><a:avLst><a:gd name="adj" fmla="val {adj}"/></a:avLst></a:prstGeom>'
+)
+_SOLID_FILL_XML = '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+_LINE_XML = '<a:ln{width}><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>{dash}</a:ln>'
+_NO_LINE_XML = "<a:ln><a:noFill/></a:ln>"
+_OUTER_SHADOW_XML = (
+    '<a:outerShdw blurRad="{blur}" dist="{dist}" dir="{direction}" rotWithShape="0">'
+    '<a:srgbClr val="000000"><a:alpha val="{alpha}"/></a:srgbClr>'
+    '</a:outerShdw>'
+)
+_AUTOSHAPE_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="{name}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '{prst_geom}'
+    '{fill}{line}{effects}</p:spPr>'
+    + _AUTOSHAPE_STYLE_XML +
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"{body_attrs}/><a:lstStyle/>'
+    '{paragraph}</p:txBody></p:sp>'
+)
+_TEXTBOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="{name}"/>'
+    '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="{wrap}"'
+    f' lIns="{TEXT_MARGIN_LR}" rIns="{TEXT_MARGIN_LR}" tIns="{TEXT_MARGIN_TB}" bIns="{TEXT_MARGIN_TB}">'
+    '{autofit}</a:bodyPr>'
+    '<a:lstStyle/>{paragraph}</p:txBody></p:sp>'
+)
+
+# Hidden off-screen "title" text box read by Storyline's TOC — see
+# _set_slide_title_for_toc(). Default add_textbox() body (no wrap, fit
+# shape to text, default insets).
+_TOC_TITLE_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="title"/>'
+    '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    f'<p:spPr><a:xfrm><a:off x="{-Cm(20)}" y="{-Cm(20)}"/><a:ext cx="{Cm(10)}" cy="{Cm(2)}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr>'
+    '<a:lstStyle/>{paragraph}</p:txBody></p:sp>'
+)
+
+# Pre-serialized bullet paragraph for _bullet_paragraphs_xml(). Alignment, RTL,
+# spacing, fonts and the ar-JO language tag are baked in, so a whole list
+# is built with one head format per list plus the escaped text per item,
+# and a single XML parse — instead of add_paragraph()/add_run() and
+# per-property setters.
+# Matches what the python-pptx API path produced: right-aligned RTL,
+# 1.4 line spacing, 10pt before/after, a 16pt colored "● " marker run
+# followed by the body text run. The item text goes between the head and
+# _BULLET_PARAGRAPH_TAIL_XML.
+_BULLET_PARAGRAPH_HEAD_XML = (
+    '<a:p>'
+    '<a:pPr algn="r" rtl="1">'
+    '<a:lnSpc><a:spcPct val="140000"/></a:lnSpc>'
+    '<a:spcBef><a:spcPts val="1000"/></a:spcBef>'
+    '<a:spcAft><a:spcPts val="1000"/></a:spcAft>'
+    '</a:pPr>'
+    '<a:r><a:rPr sz="1600" b="0" lang="ar-JO">'
+    '<a:solidFill><a:srgbClr val="{marker_color}"/></a:solidFill>'
+    '<a:cs typeface="{font}"/><a:latin typeface="{font}"/><a:ea typeface="{font}"/>'
+    '</a:rPr><a:t>\u25CF </a:t></a:r>'
+    '<a:r><a:rPr sz="{size}" b="0" lang="ar-JO">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+    '<a:cs typeface="{font}"/><a:latin typeface="{font}"/><a:ea typeface="{font}"/>'
+    '</a:rPr><a:t>'
+)
+_BULLET_PARAGRAPH_TAIL_XML = '</a:t></a:r></a:p>'
+
+# Paragraph properties shared by every add_summary_slide() item: right-aligned
+# RTL, 1.5 line spacing and 8pt space after
+_SUMMARY_PPR_XML = (
+    '<a:pPr algn="r" rtl="1">'
+    '<a:lnSpc><a:spcPct val="150000"/></a:lnSpc>'
+    '<a:spcAft><a:spcPts val="800"/></a:spcAft>'
+    '</a:pPr>'
+)
+
+# Pre-serialized body paragraph for _write_body_paragraphs() — same RTL run
+# formatting as _add_arabic_textbox() (1.3 line spacing), plus 6pt space
+# before so consecutive paragraphs stay visually separated.
+_BODY_PARAGRAPH_XML = (
+    '<a:p>'
+    '<a:pPr algn="r" rtl="1">'
+    '<a:lnSpc><a:spcPct val="130000"/></a:lnSpc>'
+    '<a:spcBef><a:spcPts val="600"/></a:spcBef>'
+    '</a:pPr>'
+    '<a:r><a:rPr sz="{size}" b="0" lang="ar-JO">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+    '<a:cs typeface="{font}"/><a:latin typeface="{font}"/><a:ea typeface="{font}"/>'
+    '</a:rPr><a:t>{text}</a:t></a:r>'
+    '</a:p>'
+)
+
+
+def _option_labels(index: int):
+    """
+    (badge letter, shape-name suffix) for the zero-based quiz option index.
+
+    The first four options get أ-د / a-d; later ones fall back to their
+    1-based number for both.
+    """
+    try:
+        return _ARABIC_LETTERS[index], _OPT_IDS[index]
+    except IndexError:
+        return str(index + 1), str(index + 1)
+
+
+# Hex strings for the design palette above, formatted once at import —
+# see _rgb_hex()
+_PALETTE_HEX = {color: str(color) for color in (
+    PRIMARY_BLUE,
+    ACCENT1_BLUE,
+    BODY_TEXT,
+    SUBTITLE_TEXT,
+    LINK_BLUE,
+    WHITE,
+    DARK_BG,
+    BUTTON_BORDER,
+    NOTES_YELLOW,
+    TEAL,
+    ACCENT_GREEN,
+    ACCENT_RED,
+    ACCENT_ORANGE,
+    LIGHT_BLUE_BG,
+    CONTENT_CARD_BG,
+    CONTENT_CARD_BORDER,
+    CARD_LIGHT_BG,
+    OPTION_ALT_BG,
+    DIVIDER_BG,
+    BULLET_MARKER_COLOR,
+    SHADOW_COLOR,
+    PRIMARY_BLUE_LIGHT,
+    PRIMARY_BLUE_DARK,
+    TEAL_LIGHT,
+    WARM_GRAY,
+    ACCENT_DEFINITION,
+    ACCENT_EXAMPLE,
+    HEADER_BAR_BLUE,
+    PLACEHOLDER_BG,
+    PLACEHOLDER_BORDER,
+    DOT_INACTIVE,
+    CARD_DARK2,
+    AMBER,
+)}
+
+
+def _rgb_hex(color) -> str:
+    """
+    Hex string ("2D588C") for an RGBColor, as written to <a:srgbClr val>.
+
+    Palette colors come from the precomputed _PALETTE_HEX; any other
+    RGBColor is formatted on the spot. Anything that is not an RGBColor is
+    rejected with the same ValueError python-pptx's color.rgb setter
+    raises, rather than being written into the XML as-is.
+    """
+    if not isinstance(color, RGBColor):
+        raise ValueError(f"assigned value must be type RGBColor, got {type(color).__name__}")
+    try:
+        return _PALETTE_HEX[color]
+    except KeyError:
+        return str(color)
+
+
+@lru_cache(maxsize=32)
+def _outer_shadow_xml(blur_pt=6, dist_pt=3, direction=2700000, opacity_pct=25) -> str:
+    """
+    Serialize an <a:outerShdw> drop shadow (no namespace declaration).
+
+    Decks only use a handful of shadow presets, so each one is formatted
+    once and reused by every card, option and drag item that carries it.
+    """
+    return _OUTER_SHADOW_XML.format(
+        blur=blur_pt * 12700,                   # Points to EMU
+        dist=dist_pt * 12700,
+        direction=direction,
+        alpha=(100 - opacity_pct) * 1000,       # OOXML alpha (0=opaque, 100000=transparent)
+    )
+
+
+def _xml_text(text) -> str:
+    """
+    Escape a string for use as <a:t> content in hand-built XML.
+
+    Applies python-pptx's own control-character escaping (so output matches
+    run.text assignment) and then XML-escapes &, < and >.
+    """
+    return escape(CT_RegularTextRun._escape_ctrl_chars(str(text)))
+
+
+# Extra entity for attribute values — escape() already handles &, < and >
+_ATTR_ENTITIES = {'"': "&quot;"}
+
+
+def _xml_attr(value) -> str:
+    """
+    Escape a string for use inside a double-quoted attribute in hand-built
+    XML (shape names, descr, typefaces): &, <, > and ".
+    """
+    return escape(str(value), _ATTR_ENTITIES)
+
+
+class _ZipPartWriter:
+    """
+    Minimal physical-package writer for python-pptx's PackageWriter.
+
+    Writes each part blob into an already-open ZipFile, so the caller
+    controls the compression settings (see LectureBuilder._save_fast).
+    Already-compressed media (PNG/JPEG/...) is stored without deflate.
+    """
+
+    def __init__(self, zipf: zipfile.ZipFile):
+        self._zipf = zipf
+
+    def write(self, pack_uri, blob: bytes):
+        if pack_uri.ext.lower() in _STORED_PART_EXTS:
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zipf.writestr(pack_uri.membername, blob)
+
 
 class LectureBuilder:
     """
@@ -254,12 +746,7 @@ class LectureBuilder:
             tpl_path = template_path
         else:
             # Default: look for the template in the standard download location
-            tpl_path = os.path.join(
-                os.path.expanduser("~"),
-                "Downloads",
-                "storyboard template",
-                "قالب المحاضرة التفاعلية- عربي.pptx",
-            )
+            tpl_path = _DEFAULT_TPL_PATH
 
         # Open the template as the base presentation — this gives us all
         # the layout backgrounds, header bars, footer bars, and logos
@@ -279,6 +766,16 @@ class LectureBuilder:
             self.prs.slide_width = SLIDE_WIDTH
             self.prs.slide_height = SLIDE_HEIGHT
 
+        # Resolve the two layouts we use once — python-pptx walks the
+        # layout list on every slide_layouts[i] lookup
+        # Layout 0 = "Title Slide", Layout 1 = "Title and Content"
+        try:
+            self._layout_title = self.prs.slide_layouts[0]
+            self._layout_content = self.prs.slide_layouts[1]
+        except IndexError:
+            # Fallback to layout 0 if the template only has one layout
+            self._layout_title = self._layout_content = self.prs.slide_layouts[0]
+
         # Store the assets directory path for PNG images
         self.assets_dir = TEMPLATE_PATH
 
@@ -293,12 +790,41 @@ class LectureBuilder:
         # Format: "المحاضرة [N]: [unit_name]"
         self.lecture_title = ""  # Will be set by add_title_slide
 
+        # (title, xml_before_id, xml_after_id) — the header bar XML for the
+        # current lecture_title, see _lecture_header_xml()
+        self._header_xml = None
+
         # Track slide count for automatic page numbering
         self.slide_count = 0
 
         # Layout variant cycle for content slides (0=A, 1=B, 2=C)
         self._content_layout_cycle = 0
 
+        # (image path, mtime_ns, size) -> its ImagePart in this package;
+        # only successful lookups are stored — see _get_image_part()
+        self._image_parts = {}
+
+        # The title slide's start button, linked to slide 2 by finalize()
+        self._btn_start = None
+
+        # Slides in deck order, as added by _add_slide_with_layout() —
+        # saves re-resolving them through prs.slides[i]
+        self._slides = []
+
+        # Slide part -> highest shape id on that slide, kept up to date by
+        # _append_shapes_xml() — see _next_shape_id()
+        self._max_shape_ids = {}
+
+        # (slide, notes_text) pairs whose notes slides are created in one
+        # pass by _flush_notes() at save time (quiz and drag-drop slides)
+        self._pending_notes = []
+
+        # Notes-slide partnames already in the package, gathered on first use
+        # (None = rescan), and the slide parts whose notes slide
+        # _notes_slide() itself created — see _notes_slide()
+        self._notes_partnames = None
+        self._own_notes_slide_parts = set()
+
     # -----------------------------------------------------------------------
     # PUBLIC METHODS — Each adds one slide type
     # -----------------------------------------------------------------------
@@ -361,7 +887,7 @@ class LectureBuilder:
             height=461665,      # ~1.28cm tall
             text=self.institution,
             font_name=FONT_EXTRABOLD,
-            font_size=Pt(24),
+            font_size=PT_24,
             bold=False,
             color=PRIMARY_BLUE,
             alignment=PP_ALIGN.CENTER,
@@ -369,38 +895,35 @@ class LectureBuilder:
         )
 
         # --- Lecture title + subtitle in a single textbox (template uses 1 box) ---
-        title_box = slide.shapes.add_textbox(6096000, 4257368, 5181600, 1077218)
-        title_box.name = "txt_title"
-        tf = title_box.text_frame
-        tf.word_wrap = True
-        tf.auto_size = MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT
-        tf.margin_left = TEXT_MARGIN_LR
-        tf.margin_right = TEXT_MARGIN_LR
-        tf.margin_top = TEXT_MARGIN_TB
-        tf.margin_bottom = TEXT_MARGIN_TB
-
-        # Title paragraph
-        p1 = tf.paragraphs[0]
-        p1.alignment = PP_ALIGN.CENTER
-        run1 = p1.add_run()
-        run1.text = title
-        self._set_run_font(run1, FONT_EXTRABOLD, Pt(24), False, PRIMARY_BLUE)
-        self._set_rtl(p1)
-
-        # Subtitle paragraph (in the same textbox, as 3rd paragraph)
+        # Title paragraph, centered RTL
+        title_paragraphs = self._paragraph_xml(
+            self._run_xml(title, FONT_EXTRABOLD, PT_24, False, PRIMARY_BLUE),
+            PP_ALIGN.CENTER,
+        )
+        # Subtitle paragraph (in the same textbox)
         if subtitle:
-            # Empty line between title and subtitle
-            p2 = tf.add_paragraph()
-            p2.alignment = PP_ALIGN.CENTER
-            run2 = p2.add_run()
-            run2.text = subtitle
-            self._set_run_font(run2, FONT_EXTRABOLD, Pt(20), False, SUBTITLE_TEXT)
-            self._set_rtl(p2)
+            title_paragraphs += self._paragraph_xml(
+                self._run_xml(subtitle, FONT_EXTRABOLD, PT_20, False, SUBTITLE_TEXT),
+                PP_ALIGN.CENTER,
+            )
+        self._append_shapes_xml(slide, [_TEXTBOX_XML.format(
+            id=self._next_shape_id(slide),
+            name="txt_title",
+            x=6096000,
+            y=4257368,
+            cx=5181600,
+            cy=1077218,
+            wrap="square",
+            # Box is pre-sized for title + subtitle — no <a:spAutoFit/> re-layout
+            autofit=_AUTOFIT_XML[MSO_AUTO_SIZE.NONE],
+            paragraph=title_paragraphs,
+        )])
 
         # --- Start button ---
         # Rounded rectangle with accent1 blue fill (#156082) and dark border
-        button = self._add_shape(
-            slide,
+        # Centered RTL caption, middle-anchored with the standard margins
+        (button_sp,) = self._append_shapes_xml(slide, [self._autoshape_xml(
+            self._next_shape_id(slide),
             MSO_SHAPE.ROUNDED_RECTANGLE,
             left=7398084,       # ~20.55cm
             top=5599525,        # ~15.55cm
@@ -408,47 +931,46 @@ class LectureBuilder:
             height=665193,      # ~1.85cm
             fill_color=ACCENT1_BLUE,   # accent1 #156082 (not #2D588C)
             border_color=BUTTON_BORDER,
-            border_width=Pt(1.5),
+            border_width=PT_1_5,
             name="btn_start",
-        )
-        # Add text to the button
-        tf_btn = button.text_frame
-        tf_btn.word_wrap = True
-        tf_btn.vertical_anchor = MSO_ANCHOR.MIDDLE
-        tf_btn.margin_left = TEXT_MARGIN_LR
-        tf_btn.margin_right = TEXT_MARGIN_LR
-        tf_btn.margin_top = TEXT_MARGIN_TB
-        tf_btn.margin_bottom = TEXT_MARGIN_TB
-        p = tf_btn.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        run = p.add_run()
-        run.text = start_button_text
-        self._set_run_font(run, FONT_REGULAR, Pt(20), False, WHITE)
-        self._set_rtl(p)
+            body_attrs=(
+                f' wrap="square" lIns="{TEXT_MARGIN_LR}" rIns="{TEXT_MARGIN_LR}"'
+                f' tIns="{TEXT_MARGIN_TB}" bIns="{TEXT_MARGIN_TB}"'
+            ),
+            paragraph_xml=self._paragraph_xml(
+                self._run_xml(start_button_text, FONT_REGULAR, PT_20, False, WHITE),
+                PP_ALIGN.CENTER,
+            ),
+        )])
+        # Remembered for finalize(), which links it to slide 2
+        if self._btn_start is None:
+            self._btn_start = SlideShapeFactory(button_sp, slide.shapes)
 
         # --- Play icon (triangle) to the right of the button ---
-        play_path = os.path.join(self.assets_dir, ASSET_PLAY_ICON)
-        if os.path.exists(play_path):
-            pic = slide.shapes.add_picture(
-                play_path,
-                9476078,    # left
-                5599525,    # top
-                619211,     # width
-                657317,     # height
-            )
-            pic.name = "icon_play"
+        icons_xml = []
+        shape_id = self._next_shape_id(slide)
+        play_pic = self._asset_picture_xml(
+            slide, shape_id, ASSET_PLAY_ICON, "icon_play",
+            9476078,    # left
+            5599525,    # top
+            619211,     # width
+            657317,     # height
+        )
+        if play_pic is not None:
+            icons_xml.append(play_pic)
+            shape_id += 1
 
         # --- Hand cursor icon below the button ---
-        hand_path = os.path.join(self.assets_dir, ASSET_HAND_CURSOR)
-        if os.path.exists(hand_path):
-            pic = slide.shapes.add_picture(
-                hand_path,
-                7570916,    # left
-                5888428,    # top
-                724001,     # width
-                752580,     # height
-            )
-            pic.name = "icon_hand"
+        hand_pic = self._asset_picture_xml(
+            slide, shape_id, ASSET_HAND_CURSOR, "icon_hand",
+            7570916,    # left
+            5888428,    # top
+            724001,     # width
+            752580,     # height
+        )
+        if hand_pic is not None:
+            icons_xml.append(hand_pic)
+        self._append_shapes_xml(slide, icons_xml)
 
         # Add Storyline import instructions as speaker notes
         self._add_notes(slide, self._build_import_instructions(title))
@@ -490,11 +1012,8 @@ class LectureBuilder:
         # Set hidden TOC title for Storyline sidebar menu
         self._set_slide_title_for_toc(slide, "الأهداف التعليمية")
 
-        # --- Lecture title bar at top ---
-        self._add_header_bar(slide, self.lecture_title)
-
-        # --- Section banner (PNG image instead of colored rectangle) ---
-        self._add_section_banner(slide, "الأهداف التعليمية")
+        # --- Lecture title bar + section banner (PNG image instead of colored rectangle) ---
+        self._add_header_and_banner(slide, "الأهداف التعليمية")
 
         # --- Intro text ---
         # "يتوقع منك في نهاية هذه المحاضرة أن تكون قادرًا على:"
@@ -506,7 +1025,7 @@ class LectureBuilder:
             height=369332,
             text="يتوقع منك في نهاية هذه المحاضرة أن تكون قادرًا على:",
             font_name=FONT_MEDIUM,
-            font_size=Pt(18),
+            font_size=PT_18,
             bold=False,
             color=BODY_TEXT,
             alignment=PP_ALIGN.RIGHT,
@@ -532,28 +1051,33 @@ class LectureBuilder:
         # row_spacing here is the full gap; convert to "step" = height + gap
         row_step = row_height + row_spacing
 
-        # Paths for PNG row assets
-        row_img_path = os.path.join(self.assets_dir, ASSET_OBJECTIVE_ROW)
-        icon_img_path = os.path.join(self.assets_dir, ASSET_TARGET_ICON)
+        # Target/circle icon and objective text geometry (from template)
+        icon_left = 10922693
+        icon_width = 703228
+        text_left = 1462617   # ~4.06cm
+        text_width = 9443403  # ~26.23cm
+        text_height = 338554  # ~0.94cm
+        # Center text vertically within the row
+        text_offset = (row_height - text_height) // 2
+
+        # Row shapes are built as XML and appended in one batch; the row
+        # PNGs come from the shared asset image parts
+        shapes_xml = []
+        shape_id = self._next_shape_id(slide)
 
         for i, objective in enumerate(objectives):
             row_top = row_top_start + (i * row_step)
 
             # Background gradient bar (image6.png) — the template uses a PNG
             obj_num = i + 1
-            if os.path.exists(row_img_path):
-                pic = slide.shapes.add_picture(
-                    row_img_path,
-                    row_left,
-                    row_top,
-                    row_width,
-                    row_height,
-                )
-                pic.name = f"bg_obj_{obj_num}"
-            else:
+            row_pic = self._asset_picture_xml(
+                slide, shape_id, ASSET_OBJECTIVE_ROW, f"bg_obj_{obj_num}",
+                row_left, row_top, row_width, row_height,
+            )
+            if row_pic is None:
                 # Fallback: colored rectangle if PNG not found
-                self._add_shape(
-                    slide,
+                row_pic = self._autoshape_xml(
+                    shape_id,
                     MSO_SHAPE.ROUNDED_RECTANGLE,
                     left=row_left,
                     top=row_top,
@@ -562,41 +1086,36 @@ class LectureBuilder:
                     fill_color=LIGHT_BLUE_BG,
                     name=f"bg_obj_{obj_num}",
                 )
+            shapes_xml.append(row_pic)
+            shape_id += 1
 
             # Target/circle icon at the right end of the row (image13.png)
-            icon_left = 10922693   # from template
-            icon_width = 703228
-            if os.path.exists(icon_img_path):
-                pic = slide.shapes.add_picture(
-                    icon_img_path,
-                    icon_left,
-                    row_top,
-                    icon_width,
-                    row_height,
-                )
-                pic.name = f"icon_obj_{obj_num}"
+            icon_pic = self._asset_picture_xml(
+                slide, shape_id, ASSET_TARGET_ICON, f"icon_obj_{obj_num}",
+                icon_left, row_top, icon_width, row_height,
+            )
+            if icon_pic is not None:
+                shapes_xml.append(icon_pic)
+                shape_id += 1
 
             # Objective text — positioned within the row
-            text_left = 1462617   # ~4.06cm
-            text_width = 9443403  # ~26.23cm
-            text_height = 338554  # ~0.94cm
-            # Center text vertically within the row
-            text_top = row_top + (row_height - text_height) // 2
-
-            self._add_arabic_textbox(
-                slide,
+            shapes_xml.append(self._textbox_xml(
+                shape_id,
                 left=text_left,
-                top=text_top,
+                top=row_top + text_offset,
                 width=text_width,
                 height=text_height,
                 text=objective,
                 font_name=FONT_REGULAR,
-                font_size=Pt(18),
+                font_size=PT_18,
                 bold=False,
                 color=BODY_TEXT,
                 alignment=PP_ALIGN.RIGHT,
                 name=f"txt_obj_{obj_num}",
-            )
+            ))
+            shape_id += 1
+
+        self._append_shapes_xml(slide, shapes_xml)
 
     def add_content_slide(
         self,
@@ -652,11 +1171,8 @@ class LectureBuilder:
         # Set hidden TOC title for Storyline sidebar menu
         self._set_slide_title_for_toc(slide, title)
 
-        # --- Lecture title bar at top ---
-        self._add_header_bar(slide, self.lecture_title)
-
-        # --- Section banner ---
-        self._add_section_banner(slide, title)
+        # --- Lecture title bar + section banner ---
+        self._add_header_and_banner(slide, title)
 
         # --- Image area (left side) ---
         # Priority: real image > auto-generated > gray placeholder > no image
@@ -669,117 +1185,89 @@ class LectureBuilder:
             # Real image — add it with aspect ratio preservation
             self._add_image(
                 slide, image_path,
-                left=Cm(2.5), top=Cm(5.5),
-                max_width=Cm(9), max_height=Cm(9),
+                left=CM_2_5, top=CM_5_5,
+                max_width=CM_9, max_height=CM_9,
                 name="img_content",
             )
             has_image = True
         elif image_placeholder:
             # Fallback: gray placeholder rectangle with text label
-            img_shape = self._add_shape(
-                slide,
+            self._append_shapes_xml(slide, [self._autoshape_xml(
+                self._next_shape_id(slide),
                 MSO_SHAPE.ROUNDED_RECTANGLE,
-                left=Cm(2.5),
-                top=Cm(5.5),
-                width=Cm(9),
-                height=Cm(9),
-                fill_color=RGBColor(0xE0, 0xE0, 0xE0),
-                border_color=RGBColor(0xBD, 0xBD, 0xBD),
-            )
-            tf = img_shape.text_frame
-            tf.word_wrap = True
-            p = tf.paragraphs[0]
-            p.alignment = PP_ALIGN.CENTER
-            run = p.add_run()
-            run.text = image_placeholder
-            self._set_run_font(run, FONT_REGULAR, Pt(12), False, BODY_TEXT)
+                left=CM_2_5,
+                top=CM_5_5,
+                width=CM_9,
+                height=CM_9,
+                fill_color=PLACEHOLDER_BG,
+                border_color=PLACEHOLDER_BORDER,
+                body_attrs=' wrap="square"',
+                paragraph_xml=self._paragraph_xml(
+                    self._run_xml(image_placeholder, FONT_REGULAR, PT_12, False, BODY_TEXT),
+                    PP_ALIGN.CENTER,
+                    rtl=False,
+                ),
+            )])
             has_image = True
 
         # --- Content body (with layout variants for visual variety) ---
         variant = self._content_layout_cycle % 3
         self._content_layout_cycle += 1
 
-        content_top = Cm(5)
-        content_height = Cm(11.5)
+        content_top = CM_5
+        content_height = CM_11_5
 
         if has_image:
             # Image mode — always use Variant A (full-width card) since layout is already varied
             variant = 0
-            content_left = Cm(13)
-            content_width = Cm(18)
+            content_left = CM_13
+            content_width = CM_18
         else:
-            content_left = Cm(3)
-            content_width = Cm(28)
+            content_left = CM_3
+            content_width = CM_28
 
         if variant == 1 and not has_image:
             # --- Variant B: Accent stripe on right, narrower content ---
             self._add_accent_stripe(slide)
-            content_width = Cm(26)  # Slightly narrower to make room for stripe
+            content_width = CM_26  # Slightly narrower to make room for stripe
 
         if variant == 2 and bullets and not has_image:
             # --- Variant C: Numbered points instead of bullet list ---
-            self._add_numbered_points(slide, bullets, start_top=content_top + Cm(0.5))
+            self._add_numbered_points(slide, bullets, start_top=content_top + CM_0_5)
         else:
             # --- Variant A or B: Card with bullets/paragraphs ---
-            if bullets:
+            if bullets or paragraphs:
+                # One rounded card that holds the body text itself; its
+                # margins reproduce the inset of the old card + textbox pair
                 card_shape = self._add_shape(
                     slide,
                     MSO_SHAPE.ROUNDED_RECTANGLE,
-                    left=content_left - Cm(0.5),
-                    top=content_top - Cm(0.3),
-                    width=content_width + Cm(1),
-                    height=content_height + Cm(0.6),
+                    left=content_left - CM_0_5,
+                    top=content_top - CM_0_3,
+                    width=content_width + CM_1,
+                    height=content_height + CM_0_6,
                     fill_color=CONTENT_CARD_BG,
                     border_color=CONTENT_CARD_BORDER,
-                    border_width=Pt(1),
-                    name="bg_content_card",
-                    corner_radius=0.04,
-                )
-                self._add_shadow_to_shape(card_shape, blur_pt=4, opacity_pct=15)
-
-                self._add_bullet_list(
-                    slide,
-                    left=content_left,
-                    top=content_top,
-                    width=content_width,
-                    height=content_height,
-                    items=bullets,
-                    font_size=Pt(20),
+                    border_width=PT_1,
                     name="txt_body",
-                )
-            elif paragraphs:
-                card_shape = self._add_shape(
-                    slide,
-                    MSO_SHAPE.ROUNDED_RECTANGLE,
-                    left=content_left - Cm(0.5),
-                    top=content_top - Cm(0.3),
-                    width=content_width + Cm(1),
-                    height=content_height + Cm(0.6),
-                    fill_color=CONTENT_CARD_BG,
-                    border_color=CONTENT_CARD_BORDER,
-                    border_width=Pt(1),
-                    name="bg_content_card",
                     corner_radius=0.04,
                 )
                 self._add_shadow_to_shape(card_shape, blur_pt=4, opacity_pct=15)
 
-                text = "\n\n".join(paragraphs)
-                self._add_arabic_textbox(
-                    slide,
-                    left=content_left,
-                    top=content_top,
-                    width=content_width,
-                    height=content_height,
-                    text=text,
-                    font_name=FONT_REGULAR,
-                    font_size=Pt(18),
-                    bold=False,
-                    color=BODY_TEXT,
-                    alignment=PP_ALIGN.RIGHT,
-                    word_wrap=True,
-                    auto_size=MSO_AUTO_SIZE.NONE,
-                    name="txt_body",
-                )
+                tf = card_shape.text_frame
+                tf.word_wrap = True
+                tf.auto_size = MSO_AUTO_SIZE.NONE
+                tf.vertical_anchor = MSO_ANCHOR.TOP
+                tf.margin_left = CM_0_5 + TEXT_MARGIN_LR
+                tf.margin_right = CM_0_5 + TEXT_MARGIN_LR
+                tf.margin_top = CM_0_3 + TEXT_MARGIN_TB
+                tf.margin_bottom = CM_0_3 + TEXT_MARGIN_TB
+
+                if bullets:
+                    self._write_bullet_paragraphs(tf, bullets, font_size=PT_20)
+                else:
+                    # One native <a:p> per paragraph (not a "\n\n"-joined run)
+                    self._write_body_paragraphs(tf, paragraphs, font_size=PT_18)
 
         # --- Speaker notes ---
         if notes:
@@ -835,39 +1323,57 @@ class LectureBuilder:
         # Set hidden TOC title for Storyline sidebar menu
         self._set_slide_title_for_toc(slide, title)
 
-        # --- Lecture title bar ---
-        self._add_header_bar(slide, self.lecture_title)
-
-        # --- Section banner ---
-        self._add_section_banner(slide, title, wide=True)
+        # --- Lecture title bar + section banner ---
+        self._add_header_and_banner(slide, title, wide=True)
 
         # --- Card layout ---
         # Calculate card dimensions based on count
         card_count = len(cards)
-        # Extended palette for 4+ cards — includes TEAL and AMBER for variety
-        CARD_DARK2 = RGBColor(0x0E, 0x28, 0x41)  # dark navy from template theme
-        AMBER = RGBColor(0xFF, 0x8F, 0x00)        # amber accent
-        default_colors = [PRIMARY_BLUE, ACCENT1_BLUE, TEAL, CARD_DARK2, AMBER, PRIMARY_BLUE]
+        if not card_count:
+            # No cards — keep the header/banner slide and its notes only
+            if notes:
+                self._add_notes(slide, notes)
+            return
 
         # Layout area for cards
-        cards_area_left = Cm(2.5)
-        cards_area_width = Cm(28.5)
-        cards_top = Cm(5.5)
-        card_height = Cm(9)  # Taller to fit larger text (was Cm(8))
+        cards_area_left = CM_2_5
+        cards_area_width = CM_28_5
+        cards_top = CM_5_5
+        card_height = CM_9  # Taller to fit larger text (was Cm(8))
+
+        # Calculate card width with gaps (a single card spans the whole area)
+        gap = CM_0_8
+        if card_count == 1:
+            card_width = int(cards_area_width)
+        else:
+            card_width = int((cards_area_width - gap * (card_count - 1)) / card_count)
+
+        # Card column positions, computed once for the whole row
+        card_step = card_width + gap
+        card_lefts = [cards_area_left + i * card_step for i in range(card_count)]
+
+        # Unpack the card dicts once, field by field
+        titles = [c.get("title", "") for c in cards]
+        bodies = [c.get("body", "") for c in cards]
+        colors = [
+            c.get("color", _DEFAULT_CARD_COLORS[i % len(_DEFAULT_CARD_COLORS)])
+            for i, c in enumerate(cards)
+        ]
 
-        # Calculate card width with gaps
-        gap = Cm(0.8)
-        total_gaps = gap * (card_count - 1) if card_count > 1 else 0
-        card_width = int((cards_area_width - total_gaps) / card_count)
+        # Card shapes are built as XML and appended in one batch (flushed
+        # early only when a thumbnail picture has to go in between)
+        shapes_xml = []
+        shape_id = self._next_shape_id(slide)
 
         for i, card_data in enumerate(cards):
             card_num = i + 1
-            card_left = int(cards_area_left + i * (card_width + gap))
-            card_color = card_data.get("color", default_colors[i % len(default_colors)])
+            card_left = card_lefts[i]
+            card_color = colors[i]
 
-            # Card background rectangle — light tinted fill instead of pure white
-            card_shape = self._add_shape(
-                slide,
+            # Card background rectangle — light tinted fill instead of pure
+            # white, with a real shadow effect
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.ROUNDED_RECTANGLE,
                 left=card_left,
                 top=cards_top,
@@ -875,22 +1381,23 @@ class LectureBuilder:
                 height=card_height,
                 fill_color=CARD_LIGHT_BG,
                 border_color=card_color,
-                border_width=Pt(2),
+                border_width=PT_2,
                 name=f"card_{card_num}",
-            )
-            # Real shadow effect on card
-            self._add_shadow_to_shape(card_shape)
+                shadow={},
+            ))
+            shape_id += 1
 
             # Thicker colored accent bar at top of card (Cm(1.2) for visual impact)
-            self._add_shape(
-                slide,
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.RECTANGLE,
                 left=card_left,
                 top=cards_top,
                 width=card_width,
-                height=Cm(1.2),
+                height=CM_1_2,
                 fill_color=card_color,
-            )
+            ))
+            shape_id += 1
 
             # Optional card thumbnail image (below accent bar, above title)
             # Auto-generate from prompt if no image path provided
@@ -899,61 +1406,68 @@ class LectureBuilder:
             if card_image_prompt and not card_image:
                 card_image = self._generate_image_for_slide(
                     card_image_prompt, "card",
-                    topic_key=f"card_{i+1}" if not card_data.get("title") else None,
+                    topic_key=f"card_{i+1}" if not titles[i] else None,
                 )
             card_has_image = False
             if card_image:
+                self._append_shapes_xml(slide, shapes_xml)
+                shapes_xml = []
                 pic = self._add_image(
                     slide, card_image,
-                    left=card_left + Cm(0.5),
-                    top=cards_top + Cm(1.5),
-                    max_width=card_width - Cm(1),
-                    max_height=Cm(3),
+                    left=card_left + CM_0_5,
+                    top=cards_top + CM_1_5,
+                    max_width=card_width - CM_1,
+                    max_height=CM_3,
                     name=f"img_card_{card_num}",
                 )
                 if pic is not None:
                     card_has_image = True
+                shape_id = self._next_shape_id(slide)
 
             # Vertical offset: shift title/body down when image is present
-            title_top = cards_top + Cm(4.8) if card_has_image else cards_top + Cm(1.2)
-            body_top = cards_top + Cm(6.5) if card_has_image else cards_top + Cm(3)
-            body_height = Cm(2.5) if card_has_image else Cm(5.5)
+            title_top = cards_top + CM_4_8 if card_has_image else cards_top + CM_1_2
+            body_top = cards_top + CM_6_5 if card_has_image else cards_top + CM_3
+            body_height = CM_2_5 if card_has_image else CM_5_5
 
             # Card title — Pt(20) for QM compliance, vertically centered
-            self._add_arabic_textbox(
-                slide,
-                left=card_left + Cm(0.5),
+            shapes_xml.append(self._textbox_xml(
+                shape_id,
+                left=card_left + CM_0_5,
                 top=title_top,
-                width=card_width - Cm(1),
-                height=Cm(1.5),
-                text=card_data.get("title", ""),
+                width=card_width - CM_1,
+                height=CM_1_5,
+                text=titles[i],
                 font_name=FONT_EXTRABOLD,
-                font_size=Pt(20),
+                font_size=PT_20,
                 bold=False,
                 color=card_color if isinstance(card_color, RGBColor) else BODY_TEXT,
                 alignment=PP_ALIGN.CENTER,
                 name=f"txt_card_{card_num}_title",
-            )
+            ))
+            shape_id += 1
 
             # Card body (if provided) — Pt(18) for QM compliance (was Pt(14))
-            body = card_data.get("body", "")
+            body = bodies[i]
             if body:
-                self._add_arabic_textbox(
-                    slide,
-                    left=card_left + Cm(0.5),
+                shapes_xml.append(self._textbox_xml(
+                    shape_id,
+                    left=card_left + CM_0_5,
                     top=body_top,
-                    width=card_width - Cm(1),
+                    width=card_width - CM_1,
                     height=body_height,
                     text=body,
                     font_name=FONT_REGULAR,
-                    font_size=Pt(18),
+                    font_size=PT_18,
                     bold=False,
                     color=BODY_TEXT,
                     alignment=PP_ALIGN.RIGHT,
                     word_wrap=True,
                     auto_size=MSO_AUTO_SIZE.NONE,
                     name=f"txt_card_{card_num}_body",
-                )
+                ))
+                shape_id += 1
+
+        self._append_shapes_xml(slide, shapes_xml)
 
         # --- Speaker notes ---
         if notes:
@@ -1015,8 +1529,8 @@ class LectureBuilder:
 
         # --- Bold PRIMARY_BLUE background for visual impact ---
         # Full-color rectangle covering most of the slide
-        card_margin_h = Cm(2)
-        card_margin_v = Cm(2)
+        card_margin_h = CM_2
+        card_margin_v = CM_2
         self._add_shape(
             slide,
             MSO_SHAPE.ROUNDED_RECTANGLE,
@@ -1033,9 +1547,9 @@ class LectureBuilder:
             slide,
             MSO_SHAPE.RECTANGLE,
             left=card_margin_h,
-            top=SLIDE_HEIGHT - Cm(4),
+            top=SLIDE_HEIGHT - CM_4,
             width=SLIDE_WIDTH - (card_margin_h * 2),
-            height=Cm(2),
+            height=CM_2,
             fill_color=PRIMARY_BLUE_DARK,
             name="bg_divider_depth",
         )
@@ -1044,10 +1558,10 @@ class LectureBuilder:
         self._add_shape(
             slide,
             MSO_SHAPE.RECTANGLE,
-            left=SLIDE_WIDTH - Cm(2.5),
-            top=Cm(2),
-            width=Cm(0.3),
-            height=SLIDE_HEIGHT - Cm(4),
+            left=SLIDE_WIDTH - CM_2_5,
+            top=CM_2,
+            width=CM_0_3,
+            height=SLIDE_HEIGHT - CM_4,
             fill_color=WHITE,
             name="accent_right_bar",
         )
@@ -1059,25 +1573,25 @@ class LectureBuilder:
         if image_path:
             self._add_image(
                 slide, image_path,
-                left=Cm(3), top=Cm(3),
-                max_width=Cm(8), max_height=Cm(8),
+                left=CM_3, top=CM_3,
+                max_width=CM_8, max_height=CM_8,
                 name="img_section_bg",
             )
 
         # --- Decorative corners — code-drawn shapes (no blurry PNGs) ---
-        self._add_decorative_corner(slide, "top_right", WHITE, Cm(4))
-        self._add_decorative_corner(slide, "bottom_left", WHITE, Cm(4))
+        self._add_decorative_corner(slide, "top_right", WHITE, CM_4)
+        self._add_decorative_corner(slide, "bottom_left", WHITE, CM_4)
 
         # --- Section title — large white text, moved up for better balance ---
         title_box = self._add_arabic_textbox(
             slide,
-            left=Cm(4),
-            top=Cm(5),
-            width=Cm(26),
-            height=Cm(3.5),
+            left=CM_4,
+            top=CM_5,
+            width=CM_26,
+            height=CM_3_5,
             text=section_title,
             font_name=FONT_EXTRABOLD,
-            font_size=Pt(40),
+            font_size=PT_40,
             bold=False,
             color=WHITE,
             alignment=PP_ALIGN.CENTER,
@@ -1089,10 +1603,10 @@ class LectureBuilder:
         self._add_shape(
             slide,
             MSO_SHAPE.RECTANGLE,
-            left=Cm(9),
-            top=Cm(8.7),
-            width=Cm(15),
-            height=Cm(0.08),
+            left=CM_9,
+            top=CM_8_7,
+            width=CM_15,
+            height=CM_0_08,
             fill_color=WHITE,
             name="divider_line",
         )
@@ -1101,13 +1615,13 @@ class LectureBuilder:
         if section_subtitle:
             self._add_arabic_textbox(
                 slide,
-                left=Cm(4),
-                top=Cm(9.3),
-                width=Cm(26),
-                height=Cm(2.5),
+                left=CM_4,
+                top=CM_9_3,
+                width=CM_26,
+                height=CM_2_5,
                 text=section_subtitle,
                 font_name=FONT_MEDIUM,
-                font_size=Pt(24),
+                font_size=PT_24,
                 bold=False,
                 color=WHITE,
                 alignment=PP_ALIGN.CENTER,
@@ -1116,17 +1630,17 @@ class LectureBuilder:
 
         # --- Progress dots showing current section position ---
         if section_number is not None and total_sections is not None:
-            dot_size = Cm(0.6)
-            dot_gap = Cm(1)
+            dot_size = CM_0_6
+            dot_gap = CM_1
             total_width = total_sections * dot_size + (total_sections - 1) * dot_gap
             dots_left = (SLIDE_WIDTH - total_width) // 2
-            dots_top = SLIDE_HEIGHT - Cm(3)
+            dots_top = SLIDE_HEIGHT - CM_3
 
             for i in range(total_sections):
                 dot_left = int(dots_left + i * (dot_size + dot_gap))
                 is_current = (i + 1) == section_number
-                dot_color = WHITE if is_current else RGBColor(0x80, 0x9F, 0xBF)
-                dot_shape_size = Cm(0.8) if is_current else dot_size
+                dot_color = WHITE if is_current else DOT_INACTIVE
+                dot_shape_size = CM_0_8 if is_current else dot_size
                 dot_offset = (dot_shape_size - dot_size) // 2 if is_current else 0
 
                 self._add_shape(
@@ -1159,7 +1673,8 @@ class LectureBuilder:
         Args:
             question: The question text in Arabic
             options: List of answer option strings (2-4 options)
-            correct_index: Zero-based index of the correct answer
+            correct_index: Zero-based index of the correct answer; must
+                point at one of the options (ValueError otherwise)
             quiz_number: Which quiz number this is (for display)
             total_quizzes: Total number of quizzes (for display)
             image_path: Optional illustration next to the question text
@@ -1190,18 +1705,19 @@ class LectureBuilder:
             ...     correct_index=1,
             ... )
         """
+        if not 0 <= correct_index < len(options):
+            raise ValueError(
+                f"correct_index {correct_index} is out of range for {len(options)} options"
+            )
         self.slide_count += 1
         slide = self._add_content_slide_with_layout()
 
         # Set hidden TOC title for Storyline sidebar menu
         self._set_slide_title_for_toc(slide, f"نشاط: {question[:30]}")
 
-        # --- Lecture title bar ---
-        self._add_header_bar(slide, self.lecture_title)
-
-        # --- Activity banner — descriptive label per QM 5.2 ---
+        # --- Lecture title bar + activity banner — descriptive label per QM 5.2 ---
         activity_title = "نشاط تفاعلي: اختيار من متعدد"
-        self._add_section_banner(slide, activity_title, wide=True)
+        self._add_header_and_banner(slide, activity_title, wide=True)
 
         # --- Optional question illustration (left side) ---
         # Auto-generate image if prompt provided but no path
@@ -1211,8 +1727,8 @@ class LectureBuilder:
         if image_path:
             pic = self._add_image(
                 slide, image_path,
-                left=Cm(2), top=Cm(4),
-                max_width=Cm(7), max_height=Cm(5),
+                left=CM_2, top=CM_4,
+                max_width=CM_7, max_height=CM_5,
                 name="img_quiz",
             )
             if pic is not None:
@@ -1220,17 +1736,17 @@ class LectureBuilder:
 
         # --- Question text — Pt(24) bold for emphasis ---
         # Narrower when image is present (shifts right to make room)
-        q_left = Cm(10) if quiz_has_image else Cm(2.5)
-        q_width = Cm(21) if quiz_has_image else Cm(29)
+        q_left = CM_10 if quiz_has_image else CM_2_5
+        q_width = CM_21 if quiz_has_image else CM_29
         self._add_arabic_textbox(
             slide,
             left=q_left,
-            top=Cm(5),
+            top=CM_5,
             width=q_width,
-            height=Cm(2),
+            height=CM_2,
             text=question,
             font_name=FONT_EXTRABOLD,
-            font_size=Pt(24),
+            font_size=PT_24,
             bold=False,
             color=BODY_TEXT,
             alignment=PP_ALIGN.RIGHT,
@@ -1240,119 +1756,107 @@ class LectureBuilder:
         )
 
         # --- Answer options ---
-        # Arabic letter badges: أ ب ج د
-        arabic_letters = ["أ", "ب", "ج", "د"]
-        option_top_start = Cm(7.5)
-        option_spacing = Cm(2.2)
-        option_height = Cm(1.7)
+        # Arabic letter badges: أ ب ج د (see _ARABIC_LETTERS)
+        option_top_start = CM_7_5
+        option_spacing = CM_2_2
+        option_height = CM_1_7
+
+        # Option shapes are built as XML and appended in one batch
+        shapes_xml = []
+        shape_id = self._next_shape_id(slide)
 
         for i, option_text in enumerate(options):
-            opt_letter = arabic_letters[i] if i < len(arabic_letters) else str(i + 1)
-            opt_id = ["a", "b", "c", "d"][i] if i < 4 else str(i + 1)
+            opt_letter, opt_id = _option_labels(i)
             option_top = int(option_top_start + i * option_spacing)
 
             # Option card with integrated badge (no separate accent border)
             option_bg = CONTENT_CARD_BG if i % 2 == 0 else WHITE
-            option_bg_shape = self._add_shape(
-                slide,
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.ROUNDED_RECTANGLE,
-                left=Cm(2.5),
-                top=option_top - Cm(0.1),
-                width=Cm(28),
-                height=option_height + Cm(0.2),
+                left=CM_2_5,
+                top=option_top - CM_0_1,
+                width=CM_28,
+                height=option_height + CM_0_2,
                 fill_color=option_bg,
                 border_color=CONTENT_CARD_BORDER,
-                border_width=Pt(0.5),
+                border_width=PT_0_5,
                 name=f"bg_opt_{opt_id}",
                 corner_radius=0.06,
-            )
-            self._add_shadow_to_shape(option_bg_shape, blur_pt=3, opacity_pct=12)
+                shadow={"blur_pt": 3, "opacity_pct": 12},
+            ))
+            shape_id += 1
 
             # Letter badge INSIDE the card (right side for RTL)
-            badge_left = Cm(28.5)
-            badge_size = Cm(1.5)
-            badge = self._add_shape(
-                slide,
+            badge_left = CM_28_5
+            badge_size = CM_1_5
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.OVAL,
                 left=badge_left,
-                top=option_top + Cm(0.1),
+                top=option_top + CM_0_1,
                 width=badge_size,
                 height=badge_size,
                 fill_color=PRIMARY_BLUE,
                 name=f"opt_{opt_id}",
-            )
-            tf = badge.text_frame
-            tf.word_wrap = False
-            tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p = tf.paragraphs[0]
-            p.alignment = PP_ALIGN.CENTER
-            run = p.add_run()
-            run.text = opt_letter
-            self._set_run_font(run, FONT_EXTRABOLD, Pt(16), False, WHITE)
+                body_attrs=' wrap="none"',
+                paragraph_xml=self._paragraph_xml(
+                    self._run_xml(opt_letter, FONT_EXTRABOLD, PT_16, False, WHITE),
+                    PP_ALIGN.CENTER,
+                    rtl=False,
+                ),
+            ))
+            shape_id += 1
 
             # Option text
-            self._add_arabic_textbox(
-                slide,
-                left=Cm(3),
+            shapes_xml.append(self._textbox_xml(
+                shape_id,
+                left=CM_3,
                 top=option_top,
-                width=Cm(24.5),
+                width=CM_24_5,
                 height=option_height,
                 text=option_text,
                 font_name=FONT_REGULAR,
-                font_size=Pt(20),
+                font_size=PT_20,
                 bold=False,
                 color=BODY_TEXT,
                 alignment=PP_ALIGN.RIGHT,
                 word_wrap=True,
                 auto_size=MSO_AUTO_SIZE.NONE,
                 name=f"txt_opt_{opt_id}",
-            )
+            ))
+            shape_id += 1
+
+        self._append_shapes_xml(slide, shapes_xml)
 
         # --- "Check Answer" button at bottom — larger with more presence ---
         check_btn = self._add_shape(
             slide,
             MSO_SHAPE.ROUNDED_RECTANGLE,
-            left=Cm(10),
-            top=Cm(16),
-            width=Cm(10),
-            height=Cm(1.6),
+            left=CM_10,
+            top=CM_16,
+            width=CM_10,
+            height=CM_1_6,
             fill_color=ACCENT1_BLUE,
             border_color=BUTTON_BORDER,
-            border_width=Pt(1.5),
+            border_width=PT_1_5,
             name="btn_check",
         )
-        tf_btn = check_btn.text_frame
-        tf_btn.word_wrap = True
-        tf_btn.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p_btn = tf_btn.paragraphs[0]
-        p_btn.alignment = PP_ALIGN.CENTER
-        run_btn = p_btn.add_run()
-        run_btn.text = "تحقق من الإجابة"
-        self._set_run_font(run_btn, FONT_EXTRABOLD, Pt(22), False, WHITE)
-        self._set_rtl(p_btn)
+        self._set_badge_text(
+            check_btn, "تحقق من الإجابة", FONT_EXTRABOLD, PT_22, WHITE, word_wrap=True, rtl=True,
+        )
 
         # Feedback instruction moved to notes to avoid edge overflow
 
         # --- Structured notes for Storyline import ---
-        correct_letter = arabic_letters[correct_index] if correct_index < len(arabic_letters) else str(correct_index + 1)
-        correct_opt_id = ["a", "b", "c", "d"][correct_index] if correct_index < 4 else str(correct_index + 1)
-        notes_text = (
-            f"=== STORYLINE INSTRUCTIONS ===\n"
-            f"Slide Type: Quiz - Multiple Choice\n"
-            f"Correct Answer: {correct_letter} (opt_{correct_opt_id})\n"
-            f"Feedback (Correct): احسنت! الاجابة صحيحة\n"
-            f"Feedback (Incorrect): الاجابة غير صحيحة، حاول مرة اخرى\n"
-            f"Points: 10\n"
-            f"Attempts: 2\n\n"
-            f"=== FREEFORM SETUP ===\n"
-            f"1. Insert > Convert to Freeform > Pick One\n"
-            f"2. Assign opt_a, opt_b, opt_c, opt_d as choices\n"
-            f"3. Set opt_{correct_opt_id} as correct answer\n"
-            f"4. btn_check triggers submit\n\n"
-            f"=== NARRATOR SCRIPT ===\n"
-            f"{question}"
+        correct_letter, correct_opt_id = _option_labels(correct_index)
+        notes_text = _QUIZ_NOTES_TMPL.format(
+            letter=correct_letter,
+            opt_id=correct_opt_id,
+            question=question,
         )
-        self._add_notes(slide, notes_text)
+        # Attached at save time — see _flush_notes()
+        self._pending_notes.append((slide, notes_text))
 
     def add_drag_drop_slide(
         self,
@@ -1400,23 +1904,20 @@ class LectureBuilder:
         # Set hidden TOC title for Storyline sidebar menu
         self._set_slide_title_for_toc(slide, "نشاط: سحب وإفلات")
 
-        # --- Lecture title bar ---
-        self._add_header_bar(slide, self.lecture_title)
-
-        # --- Activity banner — descriptive label per QM 5.2 ---
+        # --- Lecture title bar + activity banner — descriptive label per QM 5.2 ---
         activity_title = "نشاط تفاعلي: سحب وترتيب"
-        self._add_section_banner(slide, activity_title, wide=True)
+        self._add_header_and_banner(slide, activity_title, wide=True)
 
         # --- Question text — Pt(20) bold for emphasis ---
         self._add_arabic_textbox(
             slide,
-            left=Cm(2.5),
-            top=Cm(5),
-            width=Cm(29),
-            height=Cm(2),
+            left=CM_2_5,
+            top=CM_5,
+            width=CM_29,
+            height=CM_2,
             text=question,
             font_name=FONT_EXTRABOLD,
-            font_size=Pt(20),
+            font_size=PT_20,
             bold=False,
             color=BODY_TEXT,
             alignment=PP_ALIGN.RIGHT,
@@ -1428,13 +1929,13 @@ class LectureBuilder:
         # --- Clear instruction text ---
         self._add_arabic_textbox(
             slide,
-            left=Cm(2.5),
-            top=Cm(7),
-            width=Cm(29),
-            height=Cm(1.2),
+            left=CM_2_5,
+            top=CM_7,
+            width=CM_29,
+            height=CM_1_2,
             text="اسحب العناصر التالية إلى الترتيب الصحيح",
             font_name=FONT_MEDIUM,
-            font_size=Pt(18),
+            font_size=PT_18,
             bold=False,
             color=ACCENT1_BLUE,
             alignment=PP_ALIGN.RIGHT,
@@ -1445,9 +1946,9 @@ class LectureBuilder:
 
         # --- Draggable items (left side) ---
         item_count = len(items)
-        items_area_left = Cm(2.5)
-        items_top = Cm(8.5)
-        item_width = Cm(12)
+        items_area_left = CM_2_5
+        items_top = CM_8_5
+        item_width = CM_12
         safe_bottom = 6300000  # Safe zone above page number
 
         # Adaptive spacing — shrinks items to fit more
@@ -1455,16 +1956,22 @@ class LectureBuilder:
             item_count=item_count,
             available_top=items_top,
             available_bottom=safe_bottom,
-            min_item_height=Cm(2),
+            min_item_height=CM_2,
         )
         item_step = item_height + gap
 
-        for i, item_text in enumerate(items):
-            # Stack items vertically
-            item_top = int(items_top + i * item_step)
+        # Row tops shared by the items and their drop zones (stacked vertically)
+        row_tops = [items_top + i * item_step for i in range(item_count)]
 
-            item_shape = self._add_shape(
-                slide,
+        # Items and drop zones are built as XML and appended in one batch
+        shapes_xml = []
+        shape_id = self._next_shape_id(slide)
+
+        for i, (item_text, item_top) in enumerate(zip(items, row_tops)):
+
+            # Drag item card with a real shadow — text Pt(20) for readability
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.ROUNDED_RECTANGLE,
                 left=items_area_left,
                 top=item_top,
@@ -1472,50 +1979,49 @@ class LectureBuilder:
                 height=item_height,
                 fill_color=CONTENT_CARD_BG,
                 border_color=PRIMARY_BLUE,
-                border_width=Pt(1.5),
+                border_width=PT_1_5,
                 name=f"drag_item_{i + 1}",
-            )
-            # Real shadow effect on drag item
-            self._add_shadow_to_shape(item_shape)
-            # Item text — Pt(20) for better readability
-            tf = item_shape.text_frame
-            tf.word_wrap = True
-            tf.margin_left = TEXT_MARGIN_LR
-            tf.margin_right = TEXT_MARGIN_LR
-            p = tf.paragraphs[0]
-            p.alignment = PP_ALIGN.CENTER
-            run = p.add_run()
-            run.text = item_text
-            self._set_run_font(run, FONT_REGULAR, Pt(20), False, BODY_TEXT)
-            self._set_rtl(p)
+                shadow={},
+                body_attrs=f' wrap="square" lIns="{TEXT_MARGIN_LR}" rIns="{TEXT_MARGIN_LR}"',
+                paragraph_xml=self._paragraph_xml(
+                    self._run_xml(item_text, FONT_REGULAR, PT_20, False, BODY_TEXT),
+                    PP_ALIGN.CENTER,
+                ),
+            ))
+            shape_id += 1
 
             # Grip indicator (shows this item is draggable)
-            self._add_arabic_textbox(
-                slide,
-                left=items_area_left + Cm(0.2),
-                top=item_top + Cm(0.2),
-                width=Cm(1),
-                height=Cm(1),
+            shapes_xml.append(self._textbox_xml(
+                shape_id,
+                left=items_area_left + CM_0_2,
+                top=item_top + CM_0_2,
+                width=CM_1,
+                height=CM_1,
                 text="\u2630",  # ☰ trigram/hamburger icon
                 font_name=FONT_REGULAR,
-                font_size=Pt(14),
+                font_size=PT_14,
                 bold=False,
                 color=WARM_GRAY,
                 alignment=PP_ALIGN.LEFT,
                 word_wrap=False,
                 auto_size=MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT,
                 name=f"icon_grip_{i + 1}",
-            )
+            ))
+            shape_id += 1
 
         # --- Numbered drop positions (right side) ---
-        drop_left = Cm(18)
-        drop_width = Cm(12)
-        for i in range(item_count):
-            drop_top = int(items_top + i * item_step)
-
-            # Drop zone rectangle with subtle card styling
-            drop_shape = self._add_shape(
-                slide,
+        drop_left = CM_18
+        drop_width = CM_12
+        # Number badge geometry is the same for every drop zone
+        badge_size = CM_1_5
+        badge_left = drop_left + drop_width - badge_size - CM_0_3
+        badge_offset = (item_height - badge_size) // 2
+        for i, drop_top in enumerate(row_tops):
+
+            # Drop zone rectangle with subtle card styling and a dashed
+            # border, "drag here" hint text inside
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.ROUNDED_RECTANGLE,
                 left=drop_left,
                 top=drop_top,
@@ -1524,60 +2030,44 @@ class LectureBuilder:
                 name=f"drop_zone_{i + 1}",
                 fill_color=CARD_LIGHT_BG,
                 border_color=CONTENT_CARD_BORDER,
-                border_width=Pt(1.5),
-            )
-
-            # Make drop zone border dashed
-            drop_shape.line.dash_style = MSO_LINE_DASH_STYLE.DASH
-
-            # "Drag here" hint text inside drop zone
-            drop_tf = drop_shape.text_frame
-            drop_tf.word_wrap = True
-            drop_tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p_hint = drop_tf.paragraphs[0]
-            p_hint.alignment = PP_ALIGN.CENTER
-            run_hint = p_hint.add_run()
-            run_hint.text = "اسحب هنا"
-            self._set_run_font(run_hint, FONT_REGULAR, Pt(14), False, WARM_GRAY)
-            self._set_rtl(p_hint)
+                border_width=PT_1_5,
+                dashed=True,
+                body_attrs=' wrap="square"',
+                paragraph_xml=self._paragraph_xml(
+                    self._run_xml("اسحب هنا", FONT_REGULAR, PT_14, False, WARM_GRAY),
+                    PP_ALIGN.CENTER,
+                ),
+            ))
+            shape_id += 1
 
             # Number badge in the drop zone
-            badge_size = Cm(1.5)
-            badge = self._add_shape(
-                slide,
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.OVAL,
-                left=drop_left + drop_width - badge_size - Cm(0.3),
-                top=drop_top + (item_height - badge_size) // 2,
+                left=badge_left,
+                top=drop_top + badge_offset,
                 width=badge_size,
                 height=badge_size,
                 fill_color=PRIMARY_BLUE,
-            )
-            tf_b = badge.text_frame
-            tf_b.word_wrap = False
-            tf_b.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p_b = tf_b.paragraphs[0]
-            p_b.alignment = PP_ALIGN.CENTER
-            run_b = p_b.add_run()
-            run_b.text = str(i + 1)
-            self._set_run_font(run_b, FONT_EXTRABOLD, Pt(16), False, WHITE)
+                body_attrs=' wrap="none"',
+                paragraph_xml=self._paragraph_xml(
+                    self._run_xml(str(i + 1), FONT_EXTRABOLD, PT_16, False, WHITE),
+                    PP_ALIGN.CENTER,
+                    rtl=False,
+                ),
+            ))
+            shape_id += 1
+
+        self._append_shapes_xml(slide, shapes_xml)
 
         # --- Structured notes for Storyline import ---
         mapping_lines = "\n".join(
             f"drag_item_{i+1} → drop_zone_{i+1}: {correct_order[i]}"
             for i in range(len(correct_order))
         )
-        notes_text = (
-            f"=== STORYLINE INSTRUCTIONS ===\n"
-            f"Slide Type: Drag and Drop - Ordering\n"
-            f"Correct Order:\n{mapping_lines}\n\n"
-            f"=== FREEFORM SETUP ===\n"
-            f"1. Insert > Convert to Freeform > Drag and Drop\n"
-            f"2. Match drag_item shapes to drop_zone shapes\n"
-            f"3. Set correct order as shown above\n\n"
-            f"=== NARRATOR SCRIPT ===\n"
-            f"{question}"
-        )
-        self._add_notes(slide, notes_text)
+        notes_text = _DRAG_DROP_NOTES_TMPL.format(mapping_lines=mapping_lines, question=question)
+        # Attached at save time — see _flush_notes()
+        self._pending_notes.append((slide, notes_text))
 
     def add_two_column_slide(
         self,
@@ -1639,11 +2129,8 @@ class LectureBuilder:
         # Set hidden TOC title for Storyline sidebar menu
         self._set_slide_title_for_toc(slide, title)
 
-        # --- Lecture title bar ---
-        self._add_header_bar(slide, self.lecture_title)
-
-        # --- Section banner ---
-        self._add_section_banner(slide, title, wide=True)
+        # --- Lecture title bar + section banner ---
+        self._add_header_and_banner(slide, title, wide=True)
 
         # --- Auto-generate column images from prompts ---
         if right_image_prompt and not right_image:
@@ -1653,12 +2140,12 @@ class LectureBuilder:
 
         # --- Column layout ---
         # Right column (primary in RTL) — positioned on the right side
-        col_top = Cm(5)
-        col_gap = Cm(1)
-        col_width = Cm(13.5)
+        col_top = CM_5
+        col_gap = CM_1
+        col_width = CM_13_5
 
-        right_col_left = Cm(17)  # Right side of slide
-        left_col_left = Cm(2.5)  # Left side of slide
+        right_col_left = CM_17  # Right side of slide
+        left_col_left = CM_2_5  # Left side of slide
 
         # Check if images present — shifts content down
         right_has_img = right_image and os.path.exists(right_image)
@@ -1669,21 +2156,21 @@ class LectureBuilder:
         # Without images: col_top(5) + col_height(10) + padding(0.6) = 15.6cm ✓
         # With images: col_top(5) + col_height(8) + img_shift(3.5) + padding(0.6) = 17.1cm ✓
         # Slide height = 19.05cm, so both fit with safe margin
-        col_height = Cm(8) if any_has_img else Cm(10)
-        img_shift = Cm(3.5)  # How much to shift content down for image
+        col_height = CM_8 if any_has_img else CM_10
+        img_shift = CM_3_5  # How much to shift content down for image
 
         # --- Right column card ---
         right_card_height = col_height + (img_shift if right_has_img else 0)
         right_card = self._add_shape(
             slide,
             MSO_SHAPE.ROUNDED_RECTANGLE,
-            left=right_col_left - Cm(0.3),
-            top=col_top - Cm(0.3),
-            width=col_width + Cm(0.6),
-            height=right_card_height + Cm(0.6),
+            left=right_col_left - CM_0_3,
+            top=col_top - CM_0_3,
+            width=col_width + CM_0_6,
+            height=right_card_height + CM_0_6,
             fill_color=WHITE,
             border_color=CONTENT_CARD_BORDER,
-            border_width=Pt(1),
+            border_width=PT_1,
             name="bg_col1_card",
             corner_radius=0.04,
         )
@@ -1694,8 +2181,8 @@ class LectureBuilder:
         if right_has_img:
             self._add_image(
                 slide, right_image,
-                left=right_col_left, top=col_top + Cm(0.3),
-                max_width=col_width, max_height=Cm(3),
+                left=right_col_left, top=col_top + CM_0_3,
+                max_width=col_width, max_height=CM_3,
                 name="img_col1",
             )
             right_content_offset = img_shift
@@ -1706,10 +2193,10 @@ class LectureBuilder:
             left=right_col_left,
             top=col_top + right_content_offset,
             width=col_width,
-            height=Cm(1.5),
+            height=CM_1_5,
             text=right_title,
             font_name=FONT_EXTRABOLD,
-            font_size=Pt(20),
+            font_size=PT_20,
             bold=False,
             color=PRIMARY_BLUE,
             alignment=PP_ALIGN.CENTER,
@@ -1720,10 +2207,10 @@ class LectureBuilder:
         self._add_shape(
             slide,
             MSO_SHAPE.RECTANGLE,
-            left=right_col_left + Cm(2),
-            top=col_top + Cm(1.5) + right_content_offset,
-            width=col_width - Cm(4),
-            height=Cm(0.15),
+            left=right_col_left + CM_2,
+            top=col_top + CM_1_5 + right_content_offset,
+            width=col_width - CM_4,
+            height=CM_0_15,
             fill_color=PRIMARY_BLUE,
         )
 
@@ -1731,11 +2218,11 @@ class LectureBuilder:
         self._add_bullet_list(
             slide,
             left=right_col_left,
-            top=col_top + Cm(2) + right_content_offset,
+            top=col_top + CM_2 + right_content_offset,
             width=col_width,
-            height=col_height - Cm(2),
+            height=col_height - CM_2,
             items=right_points,
-            font_size=Pt(18),
+            font_size=PT_18,
             name="txt_col1_body",
         )
 
@@ -1744,13 +2231,13 @@ class LectureBuilder:
         left_card = self._add_shape(
             slide,
             MSO_SHAPE.ROUNDED_RECTANGLE,
-            left=left_col_left - Cm(0.3),
-            top=col_top - Cm(0.3),
-            width=col_width + Cm(0.6),
-            height=left_card_height + Cm(0.6),
+            left=left_col_left - CM_0_3,
+            top=col_top - CM_0_3,
+            width=col_width + CM_0_6,
+            height=left_card_height + CM_0_6,
             fill_color=WHITE,
             border_color=CONTENT_CARD_BORDER,
-            border_width=Pt(1),
+            border_width=PT_1,
             name="bg_col2_card",
             corner_radius=0.04,
         )
@@ -1761,8 +2248,8 @@ class LectureBuilder:
         if left_has_img:
             self._add_image(
                 slide, left_image,
-                left=left_col_left, top=col_top + Cm(0.3),
-                max_width=col_width, max_height=Cm(3),
+                left=left_col_left, top=col_top + CM_0_3,
+                max_width=col_width, max_height=CM_3,
                 name="img_col2",
             )
             left_content_offset = img_shift
@@ -1773,10 +2260,10 @@ class LectureBuilder:
             left=left_col_left,
             top=col_top + left_content_offset,
             width=col_width,
-            height=Cm(1.5),
+            height=CM_1_5,
             text=left_title,
             font_name=FONT_EXTRABOLD,
-            font_size=Pt(20),
+            font_size=PT_20,
             bold=False,
             color=ACCENT1_BLUE,
             alignment=PP_ALIGN.CENTER,
@@ -1787,10 +2274,10 @@ class LectureBuilder:
         self._add_shape(
             slide,
             MSO_SHAPE.RECTANGLE,
-            left=left_col_left + Cm(2),
-            top=col_top + Cm(1.5) + left_content_offset,
-            width=col_width - Cm(4),
-            height=Cm(0.15),
+            left=left_col_left + CM_2,
+            top=col_top + CM_1_5 + left_content_offset,
+            width=col_width - CM_4,
+            height=CM_0_15,
             fill_color=ACCENT1_BLUE,
         )
 
@@ -1798,11 +2285,11 @@ class LectureBuilder:
         self._add_bullet_list(
             slide,
             left=left_col_left,
-            top=col_top + Cm(2) + left_content_offset,
+            top=col_top + CM_2 + left_content_offset,
             width=col_width,
-            height=col_height - Cm(2),
+            height=col_height - CM_2,
             items=left_points,
-            font_size=Pt(18),
+            font_size=PT_18,
             name="txt_col2_body",
         )
 
@@ -1847,69 +2334,57 @@ class LectureBuilder:
         # Set hidden TOC title for Storyline sidebar menu
         self._set_slide_title_for_toc(slide, "ملخص المحاضرة")
 
-        # --- Lecture title bar ---
-        self._add_header_bar(slide, self.lecture_title)
+        # --- Lecture title bar + section banner ---
+        self._add_header_and_banner(slide, "ملخّص الوحدة الدراسيّة", wide=True)
 
-        # --- Section banner ---
-        self._add_section_banner(slide, "ملخّص الوحدة الدراسيّة", wide=True)
+        # Card background and summary text box are appended in one batch
+        shape_id = self._next_shape_id(slide)
 
         # --- Summary content card background for professional look ---
-        self._add_shape(
-            slide,
+        card_xml = self._autoshape_xml(
+            shape_id,
             MSO_SHAPE.ROUNDED_RECTANGLE,
-            left=Cm(2),
-            top=Cm(4.2),
-            width=Cm(30),
-            height=Cm(10.5),
+            left=CM_2,
+            top=CM_4_2,
+            width=CM_30,
+            height=CM_10_5,
             fill_color=CONTENT_CARD_BG,
             border_color=CONTENT_CARD_BORDER,
-            border_width=Pt(1),
+            border_width=PT_1,
             name="bg_summary_card",
         )
 
-        # Build each item as a paragraph with bold label + regular text
-        txBox = slide.shapes.add_textbox(Cm(2.5), Cm(4.5), Cm(29), Cm(10))
-        txBox.name = "txt_summary"
-        tf = txBox.text_frame
-        tf.word_wrap = True
-        tf.auto_size = MSO_AUTO_SIZE.NONE
-        tf.margin_left = TEXT_MARGIN_LR
-        tf.margin_right = TEXT_MARGIN_LR
-        tf.margin_top = TEXT_MARGIN_TB
-        tf.margin_bottom = TEXT_MARGIN_TB
-
-        for idx, item in enumerate(summary_items):
-            if idx == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
-
-            p.alignment = PP_ALIGN.RIGHT
-            p.line_spacing = 1.5
-            p.space_after = Pt(8)
-
-            if isinstance(item, dict):
-                title = item.get("title", "")
-                text = item.get("text", item.get("body", ""))
-                if title:
-                    # Bold label run (PRIMARY_BLUE for emphasis)
-                    label_run = p.add_run()
-                    label_run.text = f"{title}: "
-                    self._set_run_font(label_run, FONT_EXTRABOLD, Pt(20), True, PRIMARY_BLUE)
-                    # Regular text run (BODY_TEXT for readability)
-                    text_run = p.add_run()
-                    text_run.text = text
-                    self._set_run_font(text_run, FONT_REGULAR, Pt(20), False, BODY_TEXT)
-                else:
-                    run = p.add_run()
-                    run.text = text
-                    self._set_run_font(run, FONT_REGULAR, Pt(20), False, BODY_TEXT)
-            else:
-                run = p.add_run()
-                run.text = str(item)
-                self._set_run_font(run, FONT_REGULAR, Pt(20), False, BODY_TEXT)
+        # Normalize items once to (label, text): dicts carry an optional
+        # "title" label and "text"/"body", anything else is plain text
+        entries = [
+            (item.get("title", ""), item.get("text", item.get("body", "")))
+            if isinstance(item, dict) else ("", str(item))
+            for item in summary_items
+        ]
 
-            self._set_rtl(p)
+        # Build each item as a paragraph with bold label + regular text
+        paragraphs = []
+        for title, text in entries:
+            # Regular text run (BODY_TEXT for readability)
+            runs = self._run_xml(text, FONT_REGULAR, PT_20, False, BODY_TEXT)
+            if title:
+                # Bold label run (PRIMARY_BLUE for emphasis) before the text
+                runs = self._run_xml(f"{title}: ", FONT_EXTRABOLD, PT_20, True, PRIMARY_BLUE) + runs
+            paragraphs.append(f"<a:p>{_SUMMARY_PPR_XML}{runs}</a:p>")
+
+        text_xml = _TEXTBOX_XML.format(
+            id=shape_id + 1,
+            name="txt_summary",
+            x=CM_2_5,
+            y=CM_4_5,
+            cx=CM_29,
+            cy=CM_10,
+            wrap="square",
+            autofit=_AUTOFIT_XML[MSO_AUTO_SIZE.NONE],
+            # An empty summary still gets its (formatted) first paragraph
+            paragraph="".join(paragraphs) or f"<a:p>{_SUMMARY_PPR_XML}</a:p>",
+        )
+        self._append_shapes_xml(slide, [card_xml, text_xml])
 
     def add_closing_slide(self, next_steps: list = None, image_path: Optional[str] = None, image_prompt: Optional[str] = None):
         """
@@ -1960,7 +2435,7 @@ class LectureBuilder:
         )
 
         # --- White content area ---
-        margin = Cm(3)
+        margin = CM_3
         self._add_shape(
             slide,
             MSO_SHAPE.ROUNDED_RECTANGLE,
@@ -1973,7 +2448,7 @@ class LectureBuilder:
         )
 
         # --- Decorative corner — code-drawn shapes (no blurry PNGs) ---
-        self._add_decorative_corner(slide, "top_right", PRIMARY_BLUE_LIGHT, Cm(3))
+        self._add_decorative_corner(slide, "top_right", PRIMARY_BLUE_LIGHT, CM_3)
 
         # --- Optional decorative illustration above thank-you text ---
         # Auto-generate image if prompt provided but no path
@@ -1983,24 +2458,24 @@ class LectureBuilder:
         if image_path:
             pic = self._add_image(
                 slide, image_path,
-                left=Cm(9), top=Cm(3.5),
-                max_width=Cm(15), max_height=Cm(5),
+                left=CM_9, top=CM_3_5,
+                max_width=CM_15, max_height=CM_5,
                 name="img_closing",
             )
             if pic is not None:
                 closing_has_image = True
 
         # --- Thank you text (shifts down when image present) ---
-        thanks_top = Cm(9) if closing_has_image else Cm(5)
+        thanks_top = CM_9 if closing_has_image else CM_5
         self._add_arabic_textbox(
             slide,
-            left=Cm(5),
+            left=CM_5,
             top=thanks_top,
-            width=Cm(24),
-            height=Cm(2.5),
+            width=CM_24,
+            height=CM_2_5,
             text="شكراً لكم",
             font_name=FONT_EXTRABOLD,
-            font_size=Pt(36),
+            font_size=PT_36,
             bold=False,
             color=PRIMARY_BLUE,
             alignment=PP_ALIGN.CENTER,
@@ -2009,74 +2484,83 @@ class LectureBuilder:
 
         # --- Next steps ---
         if next_steps:
+            # The whole next-steps block is built as XML and appended in
+            # one batch
+            shapes_xml = []
+            shape_id = self._next_shape_id(slide)
+
             # Accent line above next steps
-            self._add_shape(
-                slide,
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.RECTANGLE,
-                left=Cm(10),
-                top=Cm(7.5),
-                width=Cm(14),
-                height=Cm(0.1),
+                left=CM_10,
+                top=CM_7_5,
+                width=CM_14,
+                height=CM_0_1,
                 fill_color=PRIMARY_BLUE,
                 name="accent_steps_line",
-            )
-
-            self._add_arabic_textbox(
-                slide,
-                left=Cm(5),
-                top=Cm(8),
-                width=Cm(24),
-                height=Cm(1.5),
+            ))
+            shape_id += 1
+
+            shapes_xml.append(self._textbox_xml(
+                shape_id,
+                left=CM_5,
+                top=CM_8,
+                width=CM_24,
+                height=CM_1_5,
                 text="الخطوات القادمة:",
                 font_name=FONT_EXTRABOLD,
-                font_size=Pt(20),
+                font_size=PT_20,
                 bold=False,
                 color=BODY_TEXT,
                 alignment=PP_ALIGN.CENTER,
                 name="txt_next_steps_label",
-            )
+            ))
+            shape_id += 1
 
             # Numbered next steps (circles instead of bullets)
             for i, step in enumerate(next_steps):
                 step_num = i + 1
-                step_top = Cm(10) + i * Cm(2)
+                step_top = CM_10 + i * CM_2
 
                 # Number circle
-                circle = self._add_shape(
-                    slide,
+                shapes_xml.append(self._autoshape_xml(
+                    shape_id,
                     MSO_SHAPE.OVAL,
-                    left=Cm(24),
+                    left=CM_24,
                     top=step_top,
-                    width=Cm(1.5),
-                    height=Cm(1.5),
+                    width=CM_1_5,
+                    height=CM_1_5,
                     fill_color=PRIMARY_BLUE,
                     name=f"num_step_{step_num}",
-                )
-                tf_c = circle.text_frame
-                tf_c.vertical_anchor = MSO_ANCHOR.MIDDLE
-                p_c = tf_c.paragraphs[0]
-                p_c.alignment = PP_ALIGN.CENTER
-                run_c = p_c.add_run()
-                run_c.text = str(step_num)
-                self._set_run_font(run_c, FONT_EXTRABOLD, Pt(16), False, WHITE)
+                    paragraph_xml=self._paragraph_xml(
+                        self._run_xml(str(step_num), FONT_EXTRABOLD, PT_16, False, WHITE),
+                        PP_ALIGN.CENTER,
+                        rtl=False,
+                    ),
+                ))
+                shape_id += 1
 
                 # Step text
-                self._add_arabic_textbox(
-                    slide,
-                    left=Cm(6),
+                shapes_xml.append(self._textbox_xml(
+                    shape_id,
+                    left=CM_6,
                     top=step_top,
-                    width=Cm(17),
-                    height=Cm(1.5),
+                    width=CM_17,
+                    height=CM_1_5,
                     text=step,
                     font_name=FONT_REGULAR,
-                    font_size=Pt(18),
+                    font_size=PT_18,
                     bold=False,
                     color=BODY_TEXT,
                     alignment=PP_ALIGN.RIGHT,
                     word_wrap=True,
                     auto_size=MSO_AUTO_SIZE.NONE,
                     name=f"txt_step_{step_num}",
-                )
+                ))
+                shape_id += 1
+
+            self._append_shapes_xml(slide, shapes_xml)
 
     def add_slider_slide(
         self,
@@ -2130,13 +2614,13 @@ class LectureBuilder:
         # --- Title/Instructions ---
         self._add_arabic_textbox(
             slide,
-            left=Cm(2.5),
-            top=Cm(2.5),
-            width=Cm(29),
-            height=Cm(2),
+            left=CM_2_5,
+            top=CM_2_5,
+            width=CM_29,
+            height=CM_2,
             text=title,
             font_name=FONT_MEDIUM,
-            font_size=Pt(18),
+            font_size=PT_18,
             bold=False,
             color=BODY_TEXT,
             alignment=PP_ALIGN.RIGHT,
@@ -2146,45 +2630,44 @@ class LectureBuilder:
         )
 
         # --- Numbered items ---
-        item_top_start = Cm(5)
-        item_spacing = Cm(2)
-
-        for i, item_data in enumerate(items):
-            item_top = int(item_top_start + i * item_spacing)
+        item_top_start = CM_5
+        item_spacing = CM_2
+        item_tops = [item_top_start + i * item_spacing for i in range(len(items))]
+
+        # Normalize items once to (number, text) — dicts may override the
+        # 1-based number, anything else is plain text
+        entries = [
+            (item_data.get("number", str(i + 1)), item_data.get("text", str(item_data)))
+            if isinstance(item_data, dict) else (str(i + 1), str(item_data))
+            for i, item_data in enumerate(items)
+        ]
+
+        for i, ((number, text), item_top) in enumerate(zip(entries, item_tops)):
             slider_num = i + 1
 
-            number = item_data.get("number", str(i + 1)) if isinstance(item_data, dict) else str(i + 1)
-            text = item_data.get("text", str(item_data)) if isinstance(item_data, dict) else str(item_data)
-
             # Number badge
             badge = self._add_shape(
                 slide,
                 MSO_SHAPE.OVAL,
-                left=Cm(28),
+                left=CM_28,
                 top=item_top,
-                width=Cm(1.5),
-                height=Cm(1.5),
+                width=CM_1_5,
+                height=CM_1_5,
                 fill_color=PRIMARY_BLUE,
                 name=f"icon_step_{slider_num}",
             )
-            tf = badge.text_frame
-            tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p = tf.paragraphs[0]
-            p.alignment = PP_ALIGN.CENTER
-            run = p.add_run()
-            run.text = number
-            self._set_run_font(run, FONT_EXTRABOLD, Pt(16), False, WHITE)
+            self._set_badge_text(badge, number, FONT_EXTRABOLD, PT_16, WHITE)
 
             # Item text — Pt(18) for QM compliance
             self._add_arabic_textbox(
                 slide,
-                left=Cm(3),
+                left=CM_3,
                 top=item_top,
-                width=Cm(24),
-                height=Cm(1.5),
+                width=CM_24,
+                height=CM_1_5,
                 text=text,
                 font_name=FONT_REGULAR,
-                font_size=Pt(18),
+                font_size=PT_18,
                 bold=False,
                 color=BODY_TEXT,
                 alignment=PP_ALIGN.RIGHT,
@@ -2245,22 +2728,19 @@ class LectureBuilder:
         # Set hidden TOC title for Storyline sidebar menu
         self._set_slide_title_for_toc(slide, title)
 
-        # --- Lecture title bar ---
-        self._add_header_bar(slide, self.lecture_title)
-
-        # --- Section banner ---
-        self._add_section_banner(slide, title, wide=True)
+        # --- Lecture title bar + section banner ---
+        self._add_header_and_banner(slide, title, wide=True)
 
         # --- Instruction text ---
         self._add_arabic_textbox(
             slide,
-            left=Cm(2.5),
-            top=Cm(4.5),
-            width=Cm(29),
-            height=Cm(1.5),
+            left=CM_2_5,
+            top=CM_4_5,
+            width=CM_29,
+            height=CM_1_5,
             text=instruction,
             font_name=FONT_MEDIUM,
-            font_size=Pt(18),
+            font_size=PT_18,
             bold=False,
             color=BODY_TEXT,
             alignment=PP_ALIGN.RIGHT,
@@ -2274,9 +2754,9 @@ class LectureBuilder:
 
         if tab_count > 4:
             # VERTICAL LIST layout for 5+ items (avoids tiny unreadable tabs)
-            list_top_start = Cm(6.5)
-            list_left = Cm(2.5)
-            list_width = Cm(28.5)
+            list_top_start = CM_6_5
+            list_left = CM_2_5
+            list_width = CM_28_5
             safe_bottom = 6300000  # Safe zone above page number
 
             # Adaptive spacing — shrinks rows to fit more items
@@ -2284,18 +2764,29 @@ class LectureBuilder:
                 item_count=tab_count,
                 available_top=list_top_start,
                 available_bottom=safe_bottom,
-                min_item_height=Cm(1.8),
+                min_item_height=CM_1_8,
             )
             row_step = row_height + row_gap
+            row_tops = [list_top_start + i * row_step for i in range(tab_count)]
+
+            # Badge and label geometry is the same for every row
+            badge_size = CM_1_5
+            badge_left = list_left + list_width - badge_size - CM_0_3
+            badge_offset = (row_height - badge_size) // 2
+            label_left = list_left + CM_0_5
+            label_width = list_width - badge_size - CM_1_5
+
+            # Row shapes are built as XML and appended in one batch
+            shapes_xml = []
+            shape_id = self._next_shape_id(slide)
 
-            for i, item in enumerate(reveal_items):
+            for i, (item, row_top) in enumerate(zip(reveal_items, row_tops)):
                 reveal_num = i + 1
-                row_top = int(list_top_start + i * row_step)
 
                 # Alternating row backgrounds for visual distinction
                 row_bg = CONTENT_CARD_BG if i % 2 == 0 else WHITE
-                self._add_shape(
-                    slide,
+                shapes_xml.append(self._autoshape_xml(
+                    shape_id,
                     MSO_SHAPE.ROUNDED_RECTANGLE,
                     left=list_left,
                     top=row_top,
@@ -2303,68 +2794,77 @@ class LectureBuilder:
                     height=row_height,
                     fill_color=row_bg,
                     border_color=CONTENT_CARD_BORDER,
-                    border_width=Pt(1),
+                    border_width=PT_1,
                     name=f"bg_reveal_{reveal_num}",
-                )
+                ))
+                shape_id += 1
 
                 # Number badge (left side in RTL = right visual side)
-                badge_size = Cm(1.5)
-                badge = self._add_shape(
-                    slide,
+                shapes_xml.append(self._autoshape_xml(
+                    shape_id,
                     MSO_SHAPE.OVAL,
-                    left=list_left + list_width - badge_size - Cm(0.3),
-                    top=row_top + (row_height - badge_size) // 2,
+                    left=badge_left,
+                    top=row_top + badge_offset,
                     width=badge_size,
                     height=badge_size,
                     fill_color=PRIMARY_BLUE,
                     name=f"btn_reveal_{reveal_num}",
-                )
-                tf_b = badge.text_frame
-                tf_b.word_wrap = False
-                tf_b.vertical_anchor = MSO_ANCHOR.MIDDLE
-                p_b = tf_b.paragraphs[0]
-                p_b.alignment = PP_ALIGN.CENTER
-                run_b = p_b.add_run()
-                run_b.text = str(i + 1)
-                self._set_run_font(run_b, FONT_EXTRABOLD, Pt(16), False, WHITE)
+                    body_attrs=' wrap="none"',
+                    paragraph_xml=self._paragraph_xml(
+                        self._run_xml(str(reveal_num), FONT_EXTRABOLD, PT_16, False, WHITE),
+                        PP_ALIGN.CENTER,
+                        rtl=False,
+                    ),
+                ))
+                shape_id += 1
 
                 # Label text — larger font
-                self._add_arabic_textbox(
-                    slide,
-                    left=list_left + Cm(0.5),
+                shapes_xml.append(self._textbox_xml(
+                    shape_id,
+                    left=label_left,
                     top=row_top,
-                    width=list_width - badge_size - Cm(1.5),
+                    width=label_width,
                     height=row_height,
                     text=item.get("label", ""),
                     font_name=FONT_EXTRABOLD,
-                    font_size=Pt(20),
+                    font_size=PT_20,
                     bold=False,
                     color=BODY_TEXT,
                     alignment=PP_ALIGN.RIGHT,
                     word_wrap=True,
                     auto_size=MSO_AUTO_SIZE.NONE,
                     name=f"txt_reveal_{reveal_num}",
-                )
+                ))
+                shape_id += 1
+
+            self._append_shapes_xml(slide, shapes_xml)
 
             # Put all detail/description text in speaker notes (Storyline handles reveal)
         else:
             # HORIZONTAL TABS layout for 4 or fewer items
-            tab_area_left = Cm(2.5)
-            tab_area_width = Cm(28.5)
-            tab_top = Cm(7)
-            tab_height = Cm(2.5)  # Taller tabs (was Cm(2))
-            gap = Cm(0.5)
+            tab_area_left = CM_2_5
+            tab_area_width = CM_28_5
+            tab_top = CM_7
+            tab_height = CM_2_5  # Taller tabs (was CM_2)
+            gap = CM_0_5
 
             total_gaps = gap * (tab_count - 1) if tab_count > 1 else 0
             tab_width = int((tab_area_width - total_gaps) / tab_count)
 
-            for i, item in enumerate(reveal_items):
-                tab_left = int(tab_area_left + i * (tab_width + gap))
+            # Tabs and the description area are built as XML and
+            # appended in one batch
+            shapes_xml = []
+            shape_id = self._next_shape_id(slide)
+
+            tab_step = tab_width + gap
+            tab_lefts = [tab_area_left + i * tab_step for i in range(tab_count)]
+
+            for i, (item, tab_left) in enumerate(zip(reveal_items, tab_lefts)):
 
                 # First tab = active (darker), rest = inactive (lighter)
                 tab_fill = PRIMARY_BLUE if i == 0 else PRIMARY_BLUE_LIGHT
-                tab_shape = self._add_shape(
-                    slide,
+                shapes_xml.append(self._autoshape_xml(
+                    shape_id,
                     MSO_SHAPE.ROUNDED_RECTANGLE,
                     left=tab_left,
                     top=tab_top,
@@ -2373,72 +2873,78 @@ class LectureBuilder:
                     fill_color=tab_fill,
                     name=f"btn_reveal_{i + 1}",
                     corner_radius=0.08,
-                )
-                tf = tab_shape.text_frame
-                tf.word_wrap = True
-                tf.margin_left = TEXT_MARGIN_LR
-                tf.margin_right = TEXT_MARGIN_LR
-                p = tf.paragraphs[0]
-                p.alignment = PP_ALIGN.CENTER
-                run = p.add_run()
-                run.text = item.get("label", "")
-                self._set_run_font(run, FONT_EXTRABOLD, Pt(18), False, WHITE)
-                self._set_rtl(p)
+                    body_attrs=f' wrap="square" lIns="{TEXT_MARGIN_LR}" rIns="{TEXT_MARGIN_LR}"',
+                    paragraph_xml=self._paragraph_xml(
+                        self._run_xml(item.get("label", ""), FONT_EXTRABOLD, PT_18, False, WHITE),
+                        PP_ALIGN.CENTER,
+                    ),
+                ))
+                shape_id += 1
 
             # --- Description area (shown on click in Storyline) ---
-            self._add_shape(
-                slide,
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.ROUNDED_RECTANGLE,
-                left=Cm(2.5),
-                top=Cm(10.5),
-                width=Cm(28.5),
-                height=Cm(5),
+                left=CM_2_5,
+                top=CM_10_5,
+                width=CM_28_5,
+                height=CM_5,
                 fill_color=LIGHT_BLUE_BG,
                 border_color=PRIMARY_BLUE,
                 name="bg_reveal_desc",
-            )
+            ))
+            shape_id += 1
 
             # Left accent bar on description area
-            self._add_shape(
-                slide,
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.RECTANGLE,
-                left=Cm(30.5),
-                top=Cm(10.5),
-                width=Cm(0.4),
-                height=Cm(5),
+                left=CM_30_5,
+                top=CM_10_5,
+                width=CM_0_4,
+                height=CM_5,
                 fill_color=PRIMARY_BLUE,
                 name="accent_desc_bar",
-            )
+            ))
+            shape_id += 1
 
             # Add first item's description as default visible text
             if reveal_items:
-                self._add_arabic_textbox(
-                    slide,
-                    left=Cm(3),
-                    top=Cm(11),
-                    width=Cm(27.5),
-                    height=Cm(4),
+                shapes_xml.append(self._textbox_xml(
+                    shape_id,
+                    left=CM_3,
+                    top=CM_11,
+                    width=CM_27_5,
+                    height=CM_4,
                     text=reveal_items[0].get("description", reveal_items[0].get("detail", "")),
                     font_name=FONT_REGULAR,
-                    font_size=Pt(18),
+                    font_size=PT_18,
                     bold=False,
                     color=BODY_TEXT,
                     alignment=PP_ALIGN.RIGHT,
                     word_wrap=True,
                     auto_size=MSO_AUTO_SIZE.NONE,
                     name="txt_reveal_desc",
-                )
+                ))
+
+            self._append_shapes_xml(slide, shapes_xml)
 
         # --- Structured notes for Storyline import ---
-        btn_names = ", ".join(f"btn_reveal_{i+1}" for i in range(tab_count))
-        layer_lines = "\n".join(
-            f"Layer {i+1}: Show content when btn_reveal_{i+1} clicked — {item.get('label', '')}"
-            for i, item in enumerate(reveal_items)
-        )
-        all_descriptions = "\n".join(
-            f"btn_reveal_{i+1} ({item.get('label', '')}): {item.get('description', item.get('detail', ''))}"
-            for i, item in enumerate(reveal_items)
-        )
+        # One pass over the items fills all three sections
+        btns = []
+        layers = []
+        descriptions = []
+        for reveal_num, item in enumerate(reveal_items, 1):
+            btn = f"btn_reveal_{reveal_num}"
+            label = item.get("label", "")
+            btns.append(btn)
+            layers.append(f"Layer {reveal_num}: Show content when {btn} clicked — {label}")
+            descriptions.append(
+                f"{btn} ({label}): {item.get('description', item.get('detail', ''))}"
+            )
+        btn_names = ", ".join(btns)
+        layer_lines = "\n".join(layers)
+        all_descriptions = "\n".join(descriptions)
         structured_notes = (
             f"=== STORYLINE INSTRUCTIONS ===\n"
             f"Slide Type: Click to Reveal\n"
@@ -2502,22 +3008,19 @@ class LectureBuilder:
         # Set hidden TOC title for Storyline sidebar menu
         self._set_slide_title_for_toc(slide, title)
 
-        # --- Lecture title bar ---
-        self._add_header_bar(slide, self.lecture_title)
-
-        # --- Activity banner ---
-        self._add_section_banner(slide, title, wide=True)
+        # --- Lecture title bar + activity banner ---
+        self._add_header_and_banner(slide, title, wide=True)
 
         # --- Instruction text ---
         self._add_arabic_textbox(
             slide,
-            left=Cm(2.5),
-            top=Cm(4.5),
-            width=Cm(29),
-            height=Cm(2),
+            left=CM_2_5,
+            top=CM_4_5,
+            width=CM_29,
+            height=CM_2,
             text=instruction,
             font_name=FONT_MEDIUM,
-            font_size=Pt(18),
+            font_size=PT_18,
             bold=False,
             color=BODY_TEXT,
             alignment=PP_ALIGN.RIGHT,
@@ -2527,7 +3030,7 @@ class LectureBuilder:
         )
 
         # --- Statement rows with dropdown indicators ---
-        row_top_start = Cm(7)
+        row_top_start = CM_7
         safe_bottom = 6300000  # Safe zone above page number
 
         # Adaptive spacing — shrinks rows to fit more items
@@ -2535,59 +3038,72 @@ class LectureBuilder:
             item_count=len(items),
             available_top=row_top_start,
             available_bottom=safe_bottom,
-            min_item_height=Cm(1.8),
+            min_item_height=CM_1_8,
         )
         dd_row_step = dd_row_height + dd_row_gap
 
+        # The dropdown caption is the same on every row
+        dropdown_paragraph = self._paragraph_xml(
+            self._run_xml("▼", FONT_REGULAR, PT_16, False, PRIMARY_BLUE),
+            PP_ALIGN.CENTER,
+            rtl=False,
+        )
+
+        # Row shapes are built as XML and appended in one batch
+        shapes_xml = []
+        shape_id = self._next_shape_id(slide)
+
         for i, item_data in enumerate(items):
             dd_num = i + 1
             row_top = int(row_top_start + i * dd_row_step)
 
             # Statement text — Pt(18) for QM compliance
-            self._add_arabic_textbox(
-                slide,
-                left=Cm(7),
+            shapes_xml.append(self._textbox_xml(
+                shape_id,
+                left=CM_7,
                 top=row_top,
-                width=Cm(22),
+                width=CM_22,
                 height=dd_row_height,
                 text=item_data.get("text", ""),
                 font_name=FONT_REGULAR,
-                font_size=Pt(18),
+                font_size=PT_18,
                 bold=False,
                 color=BODY_TEXT,
                 alignment=PP_ALIGN.RIGHT,
                 word_wrap=True,
                 auto_size=MSO_AUTO_SIZE.NONE,
                 name=f"txt_statement_{dd_num}",
-            )
+            ))
+            shape_id += 1
 
-            # Dropdown indicator (simulated with a shape)
-            dropdown = self._add_shape(
-                slide,
+            # Dropdown indicator (simulated with a shape), middle-anchored
+            shapes_xml.append(self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.ROUNDED_RECTANGLE,
-                left=Cm(2.5),
+                left=CM_2_5,
                 top=row_top,
-                width=Cm(4),
+                width=CM_4,
                 height=dd_row_height,
                 fill_color=WHITE,
                 border_color=PRIMARY_BLUE,
                 name=f"btn_dropdown_{dd_num}",
-            )
-            tf = dropdown.text_frame
-            tf.word_wrap = True
-            tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p = tf.paragraphs[0]
-            p.alignment = PP_ALIGN.CENTER
-            run = p.add_run()
-            run.text = "▼"
-            self._set_run_font(run, FONT_REGULAR, Pt(16), False, PRIMARY_BLUE)
+                body_attrs=' wrap="square"',
+                paragraph_xml=dropdown_paragraph,
+            ))
+            shape_id += 1
+
+        self._append_shapes_xml(slide, shapes_xml)
 
         # --- Notes with correct answers ---
-        correct_text = "\n".join(
-            f"{item.get('text', '')[:40]}... → {item.get('correct', '')}"
-            for item in items
-        )
-        notes_text = notes if notes else f"الإجابة الصحيحة:\n{correct_text}"
+        # (custom notes replace the generated answer key entirely)
+        if notes:
+            notes_text = notes
+        else:
+            correct_text = "\n".join(
+                f"{item.get('text', '')[:40]}... → {item.get('correct', '')}"
+                for item in items
+            )
+            notes_text = f"الإجابة الصحيحة:\n{correct_text}"
         self._add_notes(slide, notes_text)
 
     def finalize(self):
@@ -2604,12 +3120,13 @@ class LectureBuilder:
             >>> builder.finalize()  # Sets up cross-slide links
             >>> builder.save("output.pptx")
         """
-        if len(self.prs.slides) > 1:
-            title_slide = self.prs.slides[0]
-            for shape in title_slide.shapes:
-                if hasattr(shape, 'name') and shape.name == "btn_start":
-                    shape.click_action.target_slide = self.prs.slides[1]
-                    break
+        button = self._btn_start
+        if button is None:
+            return
+        slides = self._slides
+        # Only when the title slide is the deck's first slide
+        if len(slides) > 1 and button.part is slides[0].part:
+            button.click_action.target_slide = slides[1]
 
     def save(self, filepath: str):
         """
@@ -2624,26 +3141,101 @@ class LectureBuilder:
         Example:
             >>> builder.save("output/DSAI/U01/DSAI_U01_Interactive_Lecture.pptx")
         """
-        # Set up cross-slide references
-        self.finalize()
-
-        # Create output directory if it doesn't exist
-        output_dir = os.path.dirname(filepath)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
+        if os.environ.get(FAST_SAVE_ENV) == "1":
+            self.save_fast(filepath)
+            return
 
+        self._prepare_save(filepath)
         self.prs.save(filepath)
 
+    def save_fast(self, filepath: str, compresslevel: int = FAST_SAVE_COMPRESSLEVEL):
+        """
+        Save the presentation like save(), but with fast zip compression.
+
+        Same deck as save(), deflated at `compresslevel` (default 1) instead
+        of python-pptx's level 6, with images stored as-is — several times
+        faster to write for slide-heavy decks, for somewhat larger files.
+        save() routes here when STORYBOARD_FAST_SAVE=1 is set.
+
+        Args:
+            filepath: Output file path
+            compresslevel: zlib level for ZIP_DEFLATED (1 = fastest)
+
+        Example:
+            >>> builder.save_fast("output/DSAI/U01/preview.pptx")
+        """
+        self._prepare_save(filepath)
+        self._save_fast(filepath, compresslevel)
+
+    def _prepare_save(self, filepath: str):
+        """
+        Finish the deck and create the output directory before writing.
+
+        Args:
+            filepath: Output file path
+        """
+        # Set up cross-slide references
+        self.finalize()
+
+        # Attach deferred speaker notes now that all slides are built
+        self._flush_notes()
+
+        # Create output directory if it doesn't exist
+        output_dir = os.path.dirname(filepath)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+    def _save_fast(self, filepath: str, compresslevel: int = FAST_SAVE_COMPRESSLEVEL):
+        """
+        Save the presentation with a low zlib compression level.
+
+        Serializes the package with python-pptx's own PackageWriter (same
+        parts, rels and [Content_Types].xml as prs.save()), but into a
+        ZipFile opened with `compresslevel`, built in memory and written
+        to disk with a single write.
+
+        Falls back to a plain prs.save() when the installed python-pptx no
+        longer has the PackageWriter internals this relies on (see
+        _FAST_SAVE_SUPPORTED).
+
+        Args:
+            filepath: Output file path
+            compresslevel: zlib level for ZIP_DEFLATED (1 = fastest)
+        """
+        package = self.prs.part.package
+        if not (_FAST_SAVE_SUPPORTED and hasattr(package, "_rels")):
+            self.prs.save(filepath)
+            return
+
+        buffer = io.BytesIO()
+        writer = PackageWriter(buffer, package._rels, tuple(package.iter_parts()))
+
+        with zipfile.ZipFile(
+            buffer, "w", compression=zipfile.ZIP_DEFLATED,
+            compresslevel=compresslevel, strict_timestamps=False,
+        ) as zipf:
+            phys_writer = _ZipPartWriter(zipf)
+            writer._write_content_types_stream(phys_writer)
+            writer._write_pkg_rels(phys_writer)
+            writer._write_parts(phys_writer)
+
+        with open(filepath, "wb") as f:
+            f.write(buffer.getbuffer())
+
     # -----------------------------------------------------------------------
     # PRIVATE HELPER METHODS
     # -----------------------------------------------------------------------
 
-    def _calculate_adaptive_spacing(self, item_count, available_top, available_bottom, min_item_height):
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _calculate_adaptive_spacing(item_count, available_top, available_bottom, min_item_height):
         """
         Calculate item height and gap to fit N items between top and bottom bounds.
 
         This prevents content from overflowing past the page number area.
         If items don't fit at their preferred height, they shrink to fit.
+        Pure integer math, so results are memoized per argument tuple —
+        decks repeat the same item counts and bounds on many slides.
 
         Args:
             item_count: Number of items to fit
@@ -2658,7 +3250,7 @@ class LectureBuilder:
             return min_item_height, 0
 
         available = available_bottom - available_top
-        min_gap = Cm(0.2)  # Minimum gap between items
+        min_gap = CM_0_2  # Minimum gap between items
 
         # Total space needed at preferred height
         total_needed = item_count * min_item_height + max(item_count - 1, 0) * min_gap
@@ -2683,7 +3275,8 @@ class LectureBuilder:
         Layout 1 = "Title and Content" (has bg, header bar, footer bar, logo)
 
         CRITICAL: Do NOT modify any placeholder shapes on the returned slide.
-        Always use slide.shapes.add_textbox() for text content.
+        Add content as new shapes from the XML templates (see the module
+        CRITICAL RULES), with ids from _next_shape_id().
 
         Args:
             layout_index: Index of the layout to use (0 or 1)
@@ -2692,12 +3285,20 @@ class LectureBuilder:
             The new slide object.
         """
         # Use the template's layouts (they contain all background elements)
-        try:
-            slide_layout = self.prs.slide_layouts[layout_index]
-        except IndexError:
-            # Fallback to layout 0 if index out of range
-            slide_layout = self.prs.slide_layouts[0]
-        return self.prs.slides.add_slide(slide_layout)
+        # — resolved once in __init__, other indexes are looked up directly
+        if layout_index == 1:
+            slide_layout = self._layout_content
+        elif layout_index == 0:
+            slide_layout = self._layout_title
+        else:
+            try:
+                slide_layout = self.prs.slide_layouts[layout_index]
+            except IndexError:
+                # Fallback to layout 0 if index out of range
+                slide_layout = self._layout_title
+        slide = self.prs.slides.add_slide(slide_layout)
+        self._slides.append(slide)
+        return slide
 
     def _add_content_slide_with_layout(self):
         """
@@ -2714,6 +3315,25 @@ class LectureBuilder:
         """
         return self._add_slide_with_layout(1)
 
+    def _add_header_and_banner(self, slide, banner_title: str, wide: bool = False):
+        """
+        Add the lecture title bar and the section banner in one batch.
+
+        Same shapes as _add_header_bar(slide, self.lecture_title) followed
+        by _add_section_banner(slide, banner_title, wide), but all three
+        (header text, banner picture, banner text) are appended with a
+        single XML parse. Used by every slide type that opens with both.
+
+        Args:
+            slide: The slide object
+            banner_title: Section banner text
+            wide: If True, uses the wider banner (for activities/summary)
+        """
+        shape_id = self._next_shape_id(slide)
+        shapes_xml = [self._lecture_header_xml(shape_id)]
+        shapes_xml.extend(self._section_banner_xml(slide, shape_id + 1, banner_title, wide))
+        self._append_shapes_xml(slide, shapes_xml)
+
     def _add_header_bar(self, slide, title: str, subtitle: str = "", color=None):
         """
         Add the lecture title bar at the top of a slide.
@@ -2733,20 +3353,47 @@ class LectureBuilder:
             +------------------------------------------+
             The bar is 14.39cm wide, centered horizontally on the slide.
         """
+        shape_id = self._next_shape_id(slide)
+        if title == self.lecture_title and color is None:
+            sp_xml = self._lecture_header_xml(shape_id)
+        else:
+            sp_xml = self._header_bar_xml(shape_id, title, color)
+        self._append_shapes_xml(slide, [sp_xml])
+
+    def _lecture_header_xml(self, shape_id: int):
+        """
+        Return the header bar XML for self.lecture_title with the given id.
+
+        The title is the same on every slide of a deck, so the fragment is
+        serialized once and only the shape id is spliced in per slide. The
+        cache is rebuilt whenever lecture_title changes.
+        """
+        cached = self._header_xml
+        if cached is None or cached[0] != self.lecture_title:
+            head, tail = self._header_bar_xml(0, self.lecture_title).split(' id="0"', 1)
+            cached = self._header_xml = (self.lecture_title, head, tail)
+        return f'{cached[1]} id="{shape_id}"{cached[2]}'
+
+    def _header_bar_xml(self, shape_id: int, title: str, color=None):
+        """
+        Serialize the lecture title bar text box (see _add_header_bar()).
+        """
         text_color = color if color else BODY_TEXT
 
-        self._add_arabic_textbox(
-            slide,
+        return self._textbox_xml(
+            shape_id,
             left=TITLE_BAR_LEFT,
             top=TITLE_BAR_TOP,
             width=TITLE_BAR_WIDTH,
             height=TITLE_BAR_HEIGHT,
             text=title,
             font_name=FONT_EXTRABOLD,
-            font_size=Pt(18),
+            font_size=PT_18,
             bold=False,
             color=text_color,
             alignment=PP_ALIGN.CENTER,
+            # Fixed-size box on the template's title bar — nothing to fit
+            auto_size=MSO_AUTO_SIZE.NONE,
             name="header_title",
         )
 
@@ -2768,44 +3415,31 @@ class LectureBuilder:
             |        [======= Title =======]           |
             +------------------------------------------+
         """
-        if wide:
-            banner_left = WIDE_BANNER_LEFT
-            banner_top = WIDE_BANNER_TOP
-            banner_width = WIDE_BANNER_WIDTH
-            banner_height = WIDE_BANNER_HEIGHT
-            text_left = WIDE_BANNER_TEXT_LEFT
-            text_top = WIDE_BANNER_TEXT_TOP
-            text_width = WIDE_BANNER_TEXT_WIDTH
-            text_height = WIDE_BANNER_TEXT_HEIGHT
-            asset_name = ASSET_BANNER_WIDE
-            font_size = Pt(20)
-        else:
-            banner_left = BANNER_LEFT
-            banner_top = BANNER_TOP
-            banner_width = BANNER_WIDTH
-            banner_height = BANNER_HEIGHT
-            text_left = NARROW_BANNER_TEXT_LEFT
-            text_top = NARROW_BANNER_TEXT_TOP
-            text_width = NARROW_BANNER_TEXT_WIDTH
-            text_height = NARROW_BANNER_TEXT_HEIGHT
-            asset_name = ASSET_BANNER_NARROW
-            font_size = Pt(18)
+        self._append_shapes_xml(
+            slide, self._section_banner_xml(slide, self._next_shape_id(slide), title, wide),
+        )
+
+    def _section_banner_xml(self, slide, shape_id: int, title: str, wide: bool = False):
+        """
+        Serialize the section banner (background + title text box).
+
+        Relates the banner PNG to the slide and returns the <p:pic> (or the
+        fallback rectangle) and the text box as two XML fragments for
+        _append_shapes_xml(), numbered from shape_id.
+        """
+        (banner_left, banner_top, banner_width, banner_height,
+         text_left, text_top, text_width, text_height,
+         asset_name, font_size) = _SECTION_BANNERS[bool(wide)]
 
         # Banner background — PNG image from the template
-        banner_path = os.path.join(self.assets_dir, asset_name)
-        if os.path.exists(banner_path):
-            pic = slide.shapes.add_picture(
-                banner_path,
-                banner_left,
-                banner_top,
-                banner_width,
-                banner_height,
-            )
-            pic.name = "header_banner"
-        else:
+        background = self._asset_picture_xml(
+            slide, shape_id, asset_name, "header_banner",
+            banner_left, banner_top, banner_width, banner_height,
+        )
+        if background is None:
             # Fallback: colored rectangle if PNG not found
-            self._add_shape(
-                slide,
+            background = self._autoshape_xml(
+                shape_id,
                 MSO_SHAPE.ROUNDED_RECTANGLE,
                 left=banner_left,
                 top=banner_top,
@@ -2816,8 +3450,8 @@ class LectureBuilder:
             )
 
         # Banner title text — dark color #333333 on light PNG bg
-        self._add_arabic_textbox(
-            slide,
+        banner_text = self._textbox_xml(
+            shape_id + 1,
             left=text_left,
             top=text_top,
             width=text_width,
@@ -2828,8 +3462,83 @@ class LectureBuilder:
             bold=False,
             color=BODY_TEXT,     # #333333 — dark text on light banner
             alignment=PP_ALIGN.CENTER,
+            # Sized to the banner PNG from the template — nothing to fit
+            auto_size=MSO_AUTO_SIZE.NONE,
             name="header_banner_text",
         )
+        return [background, banner_text]
+
+    def _get_image_part(self, image_path: str):
+        """
+        Return the package ImagePart for an image file, or None if missing.
+
+        The part is looked up once per file version and then reused, so
+        slides that repeat an image (the banner on every content slide) only
+        add a relationship to it — python-pptx would otherwise re-read and
+        re-hash the file and scan every image part in the package on each
+        slide. The cache key includes the file's mtime and size, so a file
+        replaced mid-build is read again, and a missing file is not
+        remembered, so one written after its first lookup is picked up.
+
+        Args:
+            image_path: Path to the image file (PNG, JPG, etc.)
+        """
+        try:
+            st = os.stat(image_path)
+        except OSError:
+            return None
+        key = (image_path, st.st_mtime_ns, st.st_size)
+        image_part = self._image_parts.get(key)
+        if image_part is None:
+            image_part = self.prs.part.package.get_or_add_image_part(image_path)
+            self._image_parts[key] = image_part
+        return image_part
+
+    def _get_asset_image_part(self, asset_name: str):
+        """
+        Return the shared ImagePart for a template PNG, or None if missing.
+
+        Args:
+            asset_name: File name inside self.assets_dir (ASSET_* constant)
+        """
+        return self._get_image_part(os.path.join(self.assets_dir, asset_name))
+
+    def _picture_xml(self, slide, shape_id: int, image_part, name: str,
+                     left: int, top: int, width: int, height: int):
+        """
+        Serialize a <p:pic> for image_part, related to the slide.
+
+        Relates image_part to the slide (one rId per part) and fills in
+        _PICTURE_XML; name=None gives the "Picture N" default name.
+        """
+        if name is None:
+            name = f"Picture {shape_id - 1}"
+        return _PICTURE_XML.format(
+            id=shape_id,
+            name=_xml_attr(name),
+            descr=_xml_attr(image_part.desc),
+            rId=slide.part.relate_to(image_part, RT.IMAGE),
+            x=int(left),
+            y=int(top),
+            cx=int(width),
+            cy=int(height),
+        )
+
+    def _asset_picture_xml(self, slide, shape_id: int, asset_name: str, name: str,
+                           left: int, top: int, width: int, height: int):
+        """
+        Serialize a template PNG as a <p:pic> string for _append_shapes_xml().
+
+        Uses the shared ImagePart from _get_asset_image_part(), so repeated
+        assets never re-read the file.
+
+        Returns:
+            The <p:pic> XML string, or None if the asset file is missing.
+        """
+        image_part = self._get_asset_image_part(asset_name)
+        if image_part is None:
+            return None
+        return self._picture_xml(slide, shape_id, image_part, name, left, top, width, height)
 
     def _add_arabic_textbox(
         self,
@@ -2840,7 +3549,7 @@ class LectureBuilder:
         height: int,
         text: str,
         font_name: str = FONT_REGULAR,
-        font_size=Pt(16),
+        font_size=PT_16,
         bold: bool = False,
         color: RGBColor = BODY_TEXT,
         alignment=PP_ALIGN.RIGHT,
@@ -2878,74 +3587,22 @@ class LectureBuilder:
         Returns:
             The created textbox shape.
         """
-        txBox = slide.shapes.add_textbox(left, top, width, height)
-        if name:
-            txBox.name = name
-        tf = txBox.text_frame
-        tf.word_wrap = word_wrap
-        tf.auto_size = auto_size
-        tf.margin_left = TEXT_MARGIN_LR
-        tf.margin_right = TEXT_MARGIN_LR
-        tf.margin_top = TEXT_MARGIN_TB
-        tf.margin_bottom = TEXT_MARGIN_TB
-
-        # Use the first (default) paragraph
-        p = tf.paragraphs[0]
-        p.alignment = alignment
-
-        # Set line spacing — default 1.3 for body text (>= 18pt) for Arabic readability
-        if line_spacing:
-            p.line_spacing = line_spacing
-        elif font_size >= Pt(18):
-            p.line_spacing = 1.3
-
-        # Add the text run
-        run = p.add_run()
-        run.text = text
-
-        # Apply font settings
-        self._set_run_font(run, font_name, font_size, bold, color)
-
-        # Set RTL direction — critical for Arabic text
-        self._set_rtl(p)
-
-        return txBox
-
-    def _set_run_font(self, run, font_name: str, font_size, bold: bool, color: RGBColor):
-        """
-        Apply font settings to a text run.
-
-        Sets size, bold, and color using the python-pptx API, then delegates
-        to the shared rtl_helpers.pptx_set_run_font_arabic() for the font
-        name assignment. This ensures the font is set on all three slots
-        (cs, latin, ea) via XML for reliable Arabic rendering.
-
-        Args:
-            run: The text run to style
-            font_name: Font family name (e.g., "Tajawal ExtraBold")
-            font_size: Font size (Pt value)
-            bold: Whether to bold the text
-            color: Text color as RGBColor
-        """
-        font = run.font
-        font.size = font_size
-        font.bold = bold
-        font.color.rgb = color
-
-        # Delegate font name + language to the shared RTL helper.
-        # This sets cs, latin, ea fonts and the ar-JO language tag via XML.
-        pptx_set_run_font_arabic(run, font_name)
-
-    def _set_rtl(self, paragraph):
-        """
-        Set paragraph direction to RTL for Arabic text.
-
-        Delegates to the shared rtl_helpers.pptx_set_paragraph_rtl().
-
-        Args:
-            paragraph: The paragraph object to set RTL on
-        """
-        pptx_set_paragraph_rtl(paragraph)
+        # The whole <p:sp> comes from _textbox_xml() and is parsed once,
+        # instead of add_textbox() followed by ~10 property writes
+        sp_xml = self._textbox_xml(
+            self._next_shape_id(slide), left, top, width, height, text,
+            font_name=font_name,
+            font_size=font_size,
+            bold=bold,
+            color=color,
+            alignment=alignment,
+            word_wrap=word_wrap,
+            auto_size=auto_size,
+            line_spacing=line_spacing,
+            name=name,
+        )
+        (sp,) = self._append_shapes_xml(slide, [sp_xml])
+        return SlideShapeFactory(sp, slide.shapes)
 
     def _validate_bounds(self, left, top, width, height, context=""):
         """
@@ -2989,6 +3646,9 @@ class LectureBuilder:
 
         Used for rectangles, rounded rectangles, ovals, etc. that make up
         the visual structure of slides (banners, cards, buttons, etc.)
+        A thin wrapper around _autoshape_xml(), so fill and border colors
+        go through the cached _rgb_hex() strings rather than python-pptx's
+        per-assignment color setters.
 
         Args:
             slide: The slide object
@@ -3006,31 +3666,21 @@ class LectureBuilder:
         Returns:
             The created shape object.
         """
-        # Check for overflow before creating the shape
-        self._validate_bounds(left, top, width, height, name or "unnamed_shape")
-
-        shape = slide.shapes.add_shape(shape_type, left, top, width, height)
-        if name:
-            shape.name = name
-
-        if fill_color:
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = fill_color
-
-        if border_color:
-            shape.line.color.rgb = border_color
-            if border_width:
-                shape.line.width = border_width
-        else:
-            # No border — set to no line
-            shape.line.fill.background()
-
-        # Set custom corner radius for rounded rectangles
-        if corner_radius is not None and shape_type == MSO_SHAPE.ROUNDED_RECTANGLE:
-            # adjustments[0] controls corner radius (0.0 to 1.0)
-            shape.adjustments[0] = corner_radius
-
-        return shape
+        sp_xml = self._autoshape_xml(
+            self._next_shape_id(slide),
+            shape_type,
+            left=left,
+            top=top,
+            width=width,
+            height=height,
+            fill_color=fill_color,
+            border_color=border_color,
+            border_width=border_width,
+            name=name or None,
+            corner_radius=corner_radius,
+        )
+        (sp,) = self._append_shapes_xml(slide, [sp_xml])
+        return SlideShapeFactory(sp, slide.shapes)
 
     def _add_shadow_to_shape(self, shape, blur_pt=6, dist_pt=3, direction=2700000, opacity_pct=25):
         """
@@ -3046,32 +3696,288 @@ class LectureBuilder:
             direction: Shadow direction in 60000ths of degree (default: 2700000 = bottom-right)
             opacity_pct: Shadow opacity 0-100 (default: 25)
         """
-        from lxml import etree
+        # Shadow XML comes from the per-preset cache, wrapped in an effectLst
+        new_effects = parse_xml(
+            f'<a:effectLst xmlns:a="{_A_NS}">'
+            f'{_outer_shadow_xml(blur_pt, dist_pt, direction, opacity_pct)}</a:effectLst>'
+        )
+
+        # Use it as the shape's effectLst, or add the shadow to an existing one
+        spPr = shape._element.spPr
+        effectLst = spPr.find(f'{{{_A_NS}}}effectLst')
+        if effectLst is None:
+            spPr.append(new_effects)
+        else:
+            effectLst.extend(list(new_effects))
+
+    def _next_shape_id(self, slide):
+        """
+        Return the next free shape id on a slide (max id + 1).
 
-        nsmap = {
-            'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-        }
+        Batched builders take this once and number their shapes from it.
+        The slide's ids are scanned once, on first use; after that the
+        builder's own per-slide counter (self._max_shape_ids, advanced by
+        _append_shapes_xml()) answers without rescanning. Safe because
+        every shape this builder adds goes through _append_shapes_xml().
+        """
+        max_id = self._max_shape_ids.get(slide.part)
+        if max_id is None:
+            max_id = max(
+                (int(i) for i in _SLIDE_IDS_XPATH(slide._element) if i.isdigit()),
+                default=0,
+            )
+            self._max_shape_ids[slide.part] = max_id
+        return max_id + 1
+
+    def _append_shapes_xml(self, slide, shapes_xml: list):
+        """
+        Append pre-serialized <p:sp> elements to a slide in one go.
 
-        # Build shadow XML
-        blur_emu = blur_pt * 12700  # Points to EMU
-        dist_emu = dist_pt * 12700
-        alpha_val = (100 - opacity_pct) * 1000  # Convert to OOXML alpha (0=opaque, 100000=transparent)
+        All fragments are parsed with a single XML parse and added to the
+        shape tree in order (before <p:extLst>, like python-pptx does), so a
+        loop that builds N shapes costs one parse instead of N add_shape()
+        calls with their per-property setters.
 
-        shadow_xml = (
-            f'<a:outerShdw xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
-            f' blurRad="{blur_emu}" dist="{dist_emu}" dir="{direction}" rotWithShape="0">'
-            f'<a:srgbClr val="000000"><a:alpha val="{alpha_val}"/></a:srgbClr>'
-            f'</a:outerShdw>'
+        Args:
+            slide: The slide object
+            shapes_xml: List of <p:sp> strings from _autoshape_xml() /
+                        _textbox_xml(), numbered from _next_shape_id()
+
+        Returns:
+            The list of appended <p:sp> elements.
+        """
+        if not shapes_xml:
+            return []
+        new_tree = parse_xml(
+            f'<p:spTree {_SHAPES_NSDECLS}>'
+            f'{"".join(shapes_xml)}</p:spTree>'
+        )
+        shapes = slide.shapes
+        spTree = shapes._spTree
+        extLst = spTree.find(f"{{{_P_NS}}}extLst")
+        new_shapes = list(new_tree)
+        if extLst is None:
+            spTree.extend(new_shapes)
+        else:
+            for sp in new_shapes:
+                extLst.addprevious(sp)
+        # Advance the slide's id counter — batches are numbered upwards,
+        # so the last shape has the top id
+        self._max_shape_ids[slide.part] = max(
+            self._max_shape_ids.get(slide.part, 0), new_shapes[-1].shape_id,
         )
-        shadow_elem = etree.fromstring(shadow_xml)
+        return new_shapes
 
-        # Find or create effectLst on the shape's spPr
-        spPr = shape._element.spPr
-        effectLst = spPr.find('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst')
-        if effectLst is None:
-            effectLst = etree.SubElement(spPr, '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst')
+    @staticmethod
+    @lru_cache(maxsize=64, typed=True)
+    def _rpr_xml(font_name: str, font_size, bold: bool, color: RGBColor):
+        """
+        Serialize the styled <a:rPr> every _run_xml() run carries.
+
+        Size, bold and color plus the Arabic font on all three slots (cs,
+        latin, ea) and the ar-JO language tag. A deck uses only a handful of
+        (font, size, bold, color) styles, so the string is memoized per style
+        and every later run with that style reuses it. typed=True keeps a
+        plain tuple from sharing a cache entry with the equal RGBColor, so it
+        still reaches _rgb_hex()'s type check.
+        """
+        return _RPR_XML.format(
+            size=font_size.centipoints,
+            bold="1" if bold else "0",
+            color=_rgb_hex(color),
+            font=_xml_attr(font_name),
+        )
+
+    def _run_xml(self, text: str, font_name: str, font_size, bold: bool, color: RGBColor):
+        """
+        Serialize one styled text run (<a:rPr> from _rpr_xml()).
+        """
+        return _RUN_XML.format(
+            rPr=self._rpr_xml(font_name, font_size, bold, color),
+            text=_xml_text(text),
+        )
+
+    def _paragraph_xml(self, runs_xml: str, alignment=PP_ALIGN.CENTER, rtl: bool = True,
+                       line_spacing: float = None):
+        """
+        Serialize one paragraph — alignment, optional RTL and line spacing.
+
+        alignment=None leaves algn unset (inherited), like a paragraph whose
+        alignment was never assigned.
+        """
+        algn = "" if alignment is None else f' algn="{PP_ALIGN.to_xml(alignment)}"'
+        rtl_attr = ' rtl="1"' if rtl else ""
+        if line_spacing:
+            pPr = _LINE_SPACING_PPR_XML.format(
+                algn=algn, rtl=rtl_attr, spacing=int(round(line_spacing * 100000.0)),
+            )
+        else:
+            pPr = _PPR_XML.format(algn=algn, rtl=rtl_attr)
+        return f"<a:p>{pPr}{runs_xml}</a:p>"
+
+    def _set_badge_text(self, shape, text: str, font_name: str, font_size, color: RGBColor,
+                        word_wrap: bool = None, rtl: bool = False):
+        """
+        Put centered, middle-anchored text into a badge or button shape in one step.
+
+        Replaces the shape's whole <p:txBody> with one built from
+        _BADGE_TXBODY_XML, instead of ~6 text-frame/paragraph/run property
+        writes per shape.
+
+        Args:
+            shape: The badge/button shape (from _add_shape())
+            text: Badge label (number or letter) or button caption
+            font_name, font_size, color: Run styling, as for _run_xml()
+            word_wrap: True/False to set wrapping, None to leave it unset
+            rtl: Mark the paragraph RTL (Arabic captions)
+        """
+        if word_wrap is None:
+            wrap = ""
+        else:
+            wrap = ' wrap="square"' if word_wrap else ' wrap="none"'
+        txBody = parse_xml(_BADGE_TXBODY_XML.format(
+            wrap=wrap,
+            paragraph=self._paragraph_xml(
+                self._run_xml(text, font_name, font_size, False, color),
+                PP_ALIGN.CENTER,
+                rtl=rtl,
+            ),
+        ))
+        sp = shape._element
+        sp.replace(sp.txBody, txBody)
+
+    def _autoshape_xml(
+        self,
+        shape_id: int,
+        shape_type,
+        left: int,
+        top: int,
+        width: int,
+        height: int,
+        fill_color: RGBColor = None,
+        border_color: RGBColor = None,
+        border_width=None,
+        name: str = None,
+        corner_radius: float = None,
+        dashed: bool = False,
+        shadow: dict = None,
+        body_attrs: str = "",
+        paragraph_xml: str = None,
+    ):
+        """
+        Serialize an autoshape as a <p:sp> string for _append_shapes_xml().
+
+        Produces the same XML as _add_shape() (+ _add_shadow_to_shape() and
+        text frame setup), so batched and one-off shapes are interchangeable.
+
+        Args:
+            shape_id: Shape id to assign (see _next_shape_id())
+            shape_type: MSO_SHAPE enum value
+            left, top, width, height: Position and size in EMU
+            fill_color, border_color, border_width, name, corner_radius:
+                As for _add_shape()
+            dashed: Dashed border (MSO_LINE_DASH_STYLE.DASH)
+            shadow: Keyword args for an outer shadow, as for
+                    _add_shadow_to_shape() (None = no shadow)
+            body_attrs: Extra <a:bodyPr> attributes (wrap, insets)
+            paragraph_xml: Text paragraph from _paragraph_xml()
+                           (default: python-pptx's empty centered paragraph)
+
+        Returns:
+            The <p:sp> XML string.
+        """
+        self._validate_bounds(left, top, width, height, name or "unnamed_shape")
+
+        preset = _PRESET_SHAPES.get(shape_type)
+        if preset is None:
+            autoshape_type = AutoShapeType(shape_type)
+            preset = (
+                autoshape_type.basename,
+                f'<a:prstGeom prst="{autoshape_type.prst}"><a:avLst/></a:prstGeom>',
+            )
+        basename, prst_geom = preset
+        if name is None:
+            name = f"{basename} {shape_id - 1}"
+
+        if corner_radius is not None and shape_type == MSO_SHAPE.ROUNDED_RECTANGLE:
+            prst_geom = _ROUND_RECT_ADJ_GEOM_XML.format(adj=int(corner_radius * 100000.0))
+
+        if border_color:
+            line = _LINE_XML.format(
+                width=f' w="{int(border_width)}"' if border_width else "",
+                color=_rgb_hex(border_color),
+                dash='<a:prstDash val="dash"/>' if dashed else "",
+            )
+        else:
+            line = _NO_LINE_XML
+
+        effects = ""
+        if shadow is not None:
+            effects = f"<a:effectLst>{_outer_shadow_xml(**shadow)}</a:effectLst>"
+
+        return _AUTOSHAPE_XML.format(
+            id=shape_id,
+            name=_xml_attr(name),
+            x=int(left),
+            y=int(top),
+            cx=int(width),
+            cy=int(height),
+            prst_geom=prst_geom,
+            fill=_SOLID_FILL_XML.format(color=_rgb_hex(fill_color)) if fill_color else "",
+            line=line,
+            effects=effects,
+            body_attrs=body_attrs,
+            paragraph=_EMPTY_SHAPE_PARAGRAPH_XML if paragraph_xml is None else paragraph_xml,
+        )
+
+    def _textbox_xml(
+        self,
+        shape_id: int,
+        left: int,
+        top: int,
+        width: int,
+        height: int,
+        text: str,
+        font_name: str = FONT_REGULAR,
+        font_size=PT_16,
+        bold: bool = False,
+        color: RGBColor = BODY_TEXT,
+        alignment=PP_ALIGN.RIGHT,
+        word_wrap: bool = True,
+        auto_size=MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT,
+        line_spacing: float = None,
+        name: str = None,
+    ):
+        """
+        Serialize an Arabic text box as a <p:sp> string for _append_shapes_xml().
+
+        Same arguments as _add_arabic_textbox() (plus the shape id), which
+        is a thin wrapper around this. Applies the 1.3 line-spacing default
+        for >= 18pt text (Arabic readability).
 
-        effectLst.append(shadow_elem)
+        Returns:
+            The <p:sp> XML string.
+        """
+        if name is None:
+            name = f"TextBox {shape_id - 1}"
+        if not line_spacing and font_size >= PT_18:
+            line_spacing = 1.3
+        paragraph = self._paragraph_xml(
+            self._run_xml(text, font_name, font_size, bold, color),
+            alignment,
+            line_spacing=line_spacing,
+        )
+        return _TEXTBOX_XML.format(
+            id=shape_id,
+            name=_xml_attr(name),
+            x=int(left),
+            y=int(top),
+            cx=int(width),
+            cy=int(height),
+            wrap="square" if word_wrap else "none",
+            autofit=_AUTOFIT_XML[auto_size],
+            paragraph=paragraph,
+        )
 
     def _add_decorative_corner(self, slide, position="top_right",
                                color=None, size=None):
@@ -3088,15 +3994,15 @@ class LectureBuilder:
             size: Overall size of the corner decoration (default: Cm(4))
         """
         line_color = color if color else WHITE
-        corner_size = size if size else Cm(4)
-        line_thickness = Pt(2)
+        corner_size = size if size else CM_4
+        line_thickness = PT_2
 
         if position == "top_right":
             # Horizontal line extending left from top-right corner area
             self._add_shape(
                 slide, MSO_SHAPE.RECTANGLE,
-                left=SLIDE_WIDTH - Cm(3) - corner_size,
-                top=Cm(2.5),
+                left=SLIDE_WIDTH - CM_3 - corner_size,
+                top=CM_2_5,
                 width=corner_size,
                 height=line_thickness,
                 fill_color=line_color,
@@ -3105,19 +4011,19 @@ class LectureBuilder:
             # Vertical line extending down from top-right corner area
             self._add_shape(
                 slide, MSO_SHAPE.RECTANGLE,
-                left=SLIDE_WIDTH - Cm(3),
-                top=Cm(2.5),
+                left=SLIDE_WIDTH - CM_3,
+                top=CM_2_5,
                 width=line_thickness,
                 height=corner_size,
                 fill_color=line_color,
                 name="deco_corner_tr_v",
             )
             # Small circle at the corner junction for elegance
-            dot_size = Cm(0.4)
+            dot_size = CM_0_4
             self._add_shape(
                 slide, MSO_SHAPE.OVAL,
-                left=SLIDE_WIDTH - Cm(3) - dot_size // 2,
-                top=Cm(2.5) - dot_size // 2,
+                left=SLIDE_WIDTH - CM_3 - dot_size // 2,
+                top=CM_2_5 - dot_size // 2,
                 width=dot_size,
                 height=dot_size,
                 fill_color=line_color,
@@ -3127,8 +4033,8 @@ class LectureBuilder:
             # Horizontal line extending right from bottom-left corner area
             self._add_shape(
                 slide, MSO_SHAPE.RECTANGLE,
-                left=Cm(3),
-                top=SLIDE_HEIGHT - Cm(2.5),
+                left=CM_3,
+                top=SLIDE_HEIGHT - CM_2_5,
                 width=corner_size,
                 height=line_thickness,
                 fill_color=line_color,
@@ -3137,19 +4043,19 @@ class LectureBuilder:
             # Vertical line extending up from bottom-left corner area
             self._add_shape(
                 slide, MSO_SHAPE.RECTANGLE,
-                left=Cm(3),
-                top=SLIDE_HEIGHT - Cm(2.5) - corner_size,
+                left=CM_3,
+                top=SLIDE_HEIGHT - CM_2_5 - corner_size,
                 width=line_thickness,
                 height=corner_size,
                 fill_color=line_color,
                 name="deco_corner_bl_v",
             )
             # Small circle at the corner junction
-            dot_size = Cm(0.4)
+            dot_size = CM_0_4
             self._add_shape(
                 slide, MSO_SHAPE.OVAL,
-                left=Cm(3) - dot_size // 2,
-                top=SLIDE_HEIGHT - Cm(2.5) - dot_size // 2,
+                left=CM_3 - dot_size // 2,
+                top=SLIDE_HEIGHT - CM_2_5 - dot_size // 2,
                 width=dot_size,
                 height=dot_size,
                 fill_color=line_color,
@@ -3211,7 +4117,8 @@ class LectureBuilder:
         a landscape image stays wide.
 
         Args:
-            image_path: Path to the image file (PNG, JPG, etc.)
+            image_path: Path to the image file (PNG, JPG, etc.), or a
+                binary file-like object holding its bytes
             max_width: Maximum allowed width in EMU
             max_height: Maximum allowed height in EMU
 
@@ -3249,6 +4156,11 @@ class LectureBuilder:
         - Missing file guard (returns None instead of crashing)
         - Shape naming for Storyline selection pane
 
+        The picture is serialized by _picture_xml() against the shared
+        ImagePart from _get_image_part() (each file is read and added to the
+        package once), takes its id from _next_shape_id() and is attached
+        with _append_shapes_xml().
+
         Args:
             slide: The slide object to add the image to
             image_path: Path to the image file (PNG, JPG, etc.)
@@ -3262,12 +4174,21 @@ class LectureBuilder:
         Returns:
             The picture shape object, or None if image file is missing.
         """
-        # Guard: don't crash if the file doesn't exist
-        if not image_path or not os.path.exists(image_path):
+        # Guard: don't crash if the file doesn't exist or isn't an image
+        if not image_path:
+            return None
+        try:
+            image_part = self._get_image_part(image_path)
+        except Exception:
+            return None
+        if image_part is None:
             return None
 
-        # Calculate display size that fits within the bounding box
-        dims = self._get_image_dimensions(image_path, max_width, max_height)
+        # Calculate display size that fits within the bounding box — read
+        # from the part's bytes, so the file itself is only read once
+        dims = self._get_image_dimensions(
+            io.BytesIO(image_part.blob), max_width, max_height,
+        )
         if dims is None:
             return None
 
@@ -3288,20 +4209,13 @@ class LectureBuilder:
         self._validate_bounds(img_left, img_top, display_w, display_h,
                               name or "unnamed_image")
 
-        # Add the picture to the slide
-        pic = slide.shapes.add_picture(
-            image_path,
-            left=img_left,
-            top=img_top,
-            width=display_w,
-            height=display_h,
+        # Add the picture to the slide (named for Storyline's Selection Pane)
+        pic_xml = self._picture_xml(
+            slide, self._next_shape_id(slide), image_part, name,
+            img_left, img_top, display_w, display_h,
         )
-
-        # Name the shape for Storyline's Selection Pane
-        if name:
-            pic.name = name
-
-        return pic
+        (pic,) = self._append_shapes_xml(slide, [pic_xml])
+        return SlideShapeFactory(pic, slide.shapes)
 
     def _add_accent_stripe(self, slide, color=None):
         """
@@ -3319,15 +4233,15 @@ class LectureBuilder:
         self._add_shape(
             slide,
             MSO_SHAPE.RECTANGLE,
-            left=Cm(31),
-            top=Cm(4),
-            width=Cm(1.2),
-            height=Cm(13),
+            left=CM_31,
+            top=CM_4,
+            width=CM_1_2,
+            height=CM_13,
             fill_color=stripe_color,
             name="bg_accent_stripe",
         )
 
-    def _add_numbered_points(self, slide, items, start_top=Cm(5.5), left=Cm(3), width=Cm(28)):
+    def _add_numbered_points(self, slide, items, start_top=CM_5_5, left=CM_3, width=CM_28):
         """
         Add content as numbered points with circle badges instead of bullets.
 
@@ -3341,14 +4255,14 @@ class LectureBuilder:
             left: Starting X position
             width: Width of content area
         """
-        point_spacing = Cm(2.5)
+        point_spacing = CM_2_5
 
         for i, item_text in enumerate(items):
             point_top = int(start_top + i * point_spacing)
             point_num = i + 1
 
             # Number badge (circle on the right for RTL)
-            badge_size = Cm(1.8)
+            badge_size = CM_1_8
             badge = self._add_shape(
                 slide,
                 MSO_SHAPE.OVAL,
@@ -3359,25 +4273,20 @@ class LectureBuilder:
                 fill_color=PRIMARY_BLUE,
                 name=f"num_point_{point_num}",
             )
-            tf = badge.text_frame
-            tf.word_wrap = False
-            tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p = tf.paragraphs[0]
-            p.alignment = PP_ALIGN.CENTER
-            run = p.add_run()
-            run.text = str(point_num)
-            self._set_run_font(run, FONT_EXTRABOLD, Pt(18), False, WHITE)
+            self._set_badge_text(
+                badge, str(point_num), FONT_EXTRABOLD, PT_18, WHITE, word_wrap=False,
+            )
 
             # Point text (to the left of badge for RTL)
             self._add_arabic_textbox(
                 slide,
                 left=left,
                 top=point_top,
-                width=width - badge_size - Cm(0.5),
+                width=width - badge_size - CM_0_5,
                 height=badge_size,
                 text=item_text,
                 font_name=FONT_REGULAR,
-                font_size=Pt(20),
+                font_size=PT_20,
                 bold=False,
                 color=BODY_TEXT,
                 alignment=PP_ALIGN.RIGHT,
@@ -3409,11 +4318,126 @@ class LectureBuilder:
 
         Args:
             slide: The slide object
-            notes_text: The notes content
+            notes_text: The notes content. Empty or whitespace-only notes
+                are skipped, so the slide gets no notes-slide part at all.
         """
-        notes_slide = slide.notes_slide
+        if not notes_text or not notes_text.strip():
+            return
+
+        notes_slide = self._notes_slide(slide)
         notes_tf = notes_slide.notes_text_frame
-        notes_tf.text = notes_text
+
+        # Same paragraphs as notes_tf.text = notes_text (one <a:p> per line,
+        # <a:br/> for vertical tabs, no run for empty text), but serialized
+        # as one string and parsed once instead of added element by element
+        paragraphs_xml = "".join([
+            "<a:p>" + "<a:br/>".join([
+                f"<a:r><a:t>{_xml_text(text)}</a:t></a:r>" if text else ""
+                for text in line.split("\v")
+            ]) + "</a:p>"
+            for line in notes_text.split("\n")
+        ])
+        self._replace_paragraphs_xml(notes_tf, paragraphs_xml)
+
+    def _notes_slide(self, slide):
+        """
+        Return the slide's notes slide, creating it if needed.
+
+        Same part, relationships and placeholders as slide.notes_slide, but
+        the new part's name comes from a cached set of notes partnames.
+        python-pptx's next_partname() walks every part in the package for
+        each new notes slide, which makes notes O(N²) in the number of
+        slides.
+
+        The cache only sees notes slides created here. A slide that already
+        has notes this helper did not create (e.g. a caller touched
+        slide.notes_slide) means the set may be stale, so it is dropped and
+        rebuilt from the package on the next new notes slide. Notes added
+        elsewhere on other slides can still collide with a cached name;
+        _flush_notes() repairs that at save time (_renumber_notes_parts()).
+
+        Args:
+            slide: The slide object
+        """
+        slide_part = slide.part
+        if slide_part.has_notes_slide:
+            if slide_part not in self._own_notes_slide_parts:
+                self._notes_partnames = None
+            return slide.notes_slide
+
+        package = slide_part.package
+        partnames = self._notes_partnames
+        if partnames is None:
+            partnames = self._notes_partnames = {
+                part.partname for part in package.iter_parts()
+                if part.partname.startswith(_NOTES_SLIDE_PREFIX)
+            }
+        # Same search as OpcPackage.next_partname(): from len + 1 downward
+        for n in range(len(partnames) + 1, 0, -1):
+            partname = _NOTES_SLIDE_PARTNAME % n
+            if partname not in partnames:
+                break
+        partnames.add(partname)
+
+        notes_master_part = package.presentation_part.notes_master_part
+        notes_slide_part = NotesSlidePart(
+            PackURI(partname), CT.PML_NOTES_SLIDE, package, CT_NotesSlide.new(),
+        )
+        notes_slide_part.relate_to(notes_master_part, RT.NOTES_MASTER)
+        notes_slide_part.relate_to(slide_part, RT.SLIDE)
+        notes_slide = notes_slide_part.notes_slide
+        notes_slide.clone_master_placeholders(notes_master_part.notes_master)
+        slide_part.relate_to(notes_slide_part, RT.NOTES_SLIDE)
+        self._own_notes_slide_parts.add(slide_part)
+        return notes_slide
+
+    def _flush_notes(self):
+        """
+        Attach all deferred speaker notes in a single pass.
+
+        Quiz and drag-drop builders queue their notes in _pending_notes
+        instead of creating the notes slide part mid-build; this adds them
+        (via _add_notes()) once the deck is complete, then clears the queue.
+        """
+        # Rescan notes partnames once for the pass, in case anything outside
+        # _notes_slide() added notes slides while the deck was being built
+        self._notes_partnames = None
+        for slide, notes_text in self._pending_notes:
+            self._add_notes(slide, notes_text)
+        self._pending_notes.clear()
+        self._renumber_notes_parts()
+
+    def _renumber_notes_parts(self):
+        """
+        Give a fresh partname to any notes slide whose name is taken twice.
+
+        One walk over the package at save time. A duplicate can only come
+        from _notes_slide()'s cached names missing a notes slide created
+        elsewhere, so the part this builder created is the one renamed;
+        relationships point at part objects, so nothing else changes.
+        """
+        by_name = {}
+        duplicates = []
+        for part in self.prs.part.package.iter_parts():
+            partname = part.partname
+            if not partname.startswith(_NOTES_SLIDE_PREFIX):
+                continue
+            other = by_name.setdefault(partname, part)
+            if other is not part:
+                # Keep the foreign part's name, rename ours
+                if other.part_related_by(RT.SLIDE) in self._own_notes_slide_parts:
+                    by_name[partname] = part
+                    part = other
+                duplicates.append(part)
+        n = len(by_name)
+        for part in duplicates:
+            n += 1
+            while _NOTES_SLIDE_PARTNAME % n in by_name:
+                n += 1
+            part.partname = PackURI(_NOTES_SLIDE_PARTNAME % n)
+            by_name[part.partname] = part
+        if duplicates:
+            self._notes_partnames = None
 
     def _set_slide_title_for_toc(self, slide, title_text: str):
         """
@@ -3429,20 +4453,14 @@ class LectureBuilder:
             slide: The slide object
             title_text: Arabic title text for the TOC entry
         """
-        # Place far off-screen so it's invisible in the presentation
-        txBox = slide.shapes.add_textbox(
-            left=-Cm(20),
-            top=-Cm(20),
-            width=Cm(10),
-            height=Cm(2),
-        )
-        txBox.name = "title"
-        tf = txBox.text_frame
-        p = tf.paragraphs[0]
-        run = p.add_run()
-        run.text = title_text
-        self._set_run_font(run, FONT_REGULAR, Pt(12), False, WHITE)
-        self._set_rtl(p)
+        # Placed far off-screen so it's invisible in the presentation
+        self._append_shapes_xml(slide, [_TOC_TITLE_XML.format(
+            id=self._next_shape_id(slide),
+            paragraph=self._paragraph_xml(
+                self._run_xml(title_text, FONT_REGULAR, PT_12, False, WHITE),
+                alignment=None,
+            ),
+        )])
 
     def _build_import_instructions(self, lecture_title: str):
         """
@@ -3495,7 +4513,7 @@ class LectureBuilder:
         width: int,
         height: int,
         items: list,
-        font_size=Pt(16),
+        font_size=PT_16,
         color: RGBColor = None,
         name: str = None,
     ):
@@ -3503,7 +4521,9 @@ class LectureBuilder:
         Add a bullet list as a text box with multiple paragraphs.
 
         Each item becomes a separate paragraph. RTL direction is set
-        on every paragraph for consistent Arabic rendering.
+        on every paragraph for consistent Arabic rendering. The whole
+        <p:sp> (wrapped, no autofit, standard margins) is built as one
+        string and parsed once.
 
         Args:
             slide: The slide object
@@ -3519,42 +4539,116 @@ class LectureBuilder:
         Returns:
             The created textbox shape.
         """
-        text_color = color if color else BODY_TEXT
+        shape_id = self._next_shape_id(slide)
+        paragraphs_xml = self._bullet_paragraphs_xml(items, font_size, color)
+        sp_xml = _TEXTBOX_XML.format(
+            id=shape_id,
+            name=_xml_attr(name or f"TextBox {shape_id - 1}"),
+            x=int(left),
+            y=int(top),
+            cx=int(width),
+            cy=int(height),
+            wrap="square",
+            autofit=_AUTOFIT_XML[MSO_AUTO_SIZE.NONE],
+            # An empty list keeps the text body's required default paragraph
+            paragraph=paragraphs_xml or "<a:p/>",
+        )
+        (sp,) = self._append_shapes_xml(slide, [sp_xml])
+        return SlideShapeFactory(sp, slide.shapes)
 
-        txBox = slide.shapes.add_textbox(left, top, width, height)
-        if name:
-            txBox.name = name
-        tf = txBox.text_frame
-        tf.word_wrap = True
-        tf.auto_size = MSO_AUTO_SIZE.NONE
-        tf.margin_left = TEXT_MARGIN_LR
-        tf.margin_right = TEXT_MARGIN_LR
-        tf.margin_top = TEXT_MARGIN_TB
-        tf.margin_bottom = TEXT_MARGIN_TB
+    def _write_bullet_paragraphs(
+        self,
+        text_frame,
+        items: list,
+        font_size=PT_16,
+        color: RGBColor = None,
+    ):
+        """
+        Fill a text frame with one bullet paragraph per item.
 
-        for i, item_text in enumerate(items):
-            # Use the existing first paragraph for the first item,
-            # add new paragraphs for subsequent items
-            if i == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
-
-            p.alignment = PP_ALIGN.RIGHT
-
-            # Colored filled circle marker (BULLET_MARKER_COLOR) + body text
-            bullet_run = p.add_run()
-            bullet_run.text = "\u25CF "  # Filled circle character
-            self._set_run_font(bullet_run, FONT_REGULAR, Pt(16), False, BULLET_MARKER_COLOR)
-
-            text_run = p.add_run()
-            text_run.text = item_text
-            self._set_run_font(text_run, FONT_REGULAR, font_size, False, text_color)
-            self._set_rtl(p)
-
-            # Comfortable spacing for Arabic bullet items
-            p.space_before = Pt(10)
-            p.space_after = Pt(10)
-            p.line_spacing = 1.4
-
-        return txBox
+        Builds every paragraph from the pre-serialized template, then swaps
+        them into the text body in one go. Each paragraph is a colored "●"
+        marker run + body text run, already RTL and spaced.
+
+        Args:
+            text_frame: The text frame to fill (textbox or shape)
+            items: List of bullet point strings
+            font_size: Font size for bullet text
+            color: Text color (default: BODY_TEXT)
+        """
+        self._replace_paragraphs_xml(
+            text_frame, self._bullet_paragraphs_xml(items, font_size, color),
+        )
+
+    def _bullet_paragraphs_xml(self, items: list, font_size=PT_16, color: RGBColor = None):
+        """
+        Serialize one bullet <a:p> per item from the pre-serialized template.
+
+        Shared by _add_bullet_list() (whole text box in one string) and
+        _write_bullet_paragraphs() (existing text frame). Returns "" for an
+        empty list.
+        """
+        # Everything but the item text is the same for the whole list
+        head = _BULLET_PARAGRAPH_HEAD_XML.format(
+            marker_color=_rgb_hex(BULLET_MARKER_COLOR),
+            font=FONT_REGULAR,
+            size=font_size.centipoints,
+            color=_rgb_hex(color if color else BODY_TEXT),
+        )
+        return "".join([
+            f"{head}{_xml_text(item_text)}{_BULLET_PARAGRAPH_TAIL_XML}"
+            for item_text in items
+        ])
+
+    def _write_body_paragraphs(
+        self,
+        text_frame,
+        paragraphs: list,
+        font_size=PT_18,
+        color: RGBColor = None,
+    ):
+        """
+        Fill a text frame with one <a:p> per body paragraph.
+
+        Like _write_bullet_paragraphs() but without markers: each string
+        becomes its own RTL, right-aligned paragraph with a small space
+        before it.
+
+        Args:
+            text_frame: The text frame to fill (textbox or shape)
+            paragraphs: List of paragraph strings
+            font_size: Font size for paragraph text
+            color: Text color (default: BODY_TEXT)
+        """
+        size = str(font_size.centipoints)
+        color_hex = _rgb_hex(color if color else BODY_TEXT)
+        paragraphs_xml = "".join(
+            _BODY_PARAGRAPH_XML.format(
+                font=FONT_REGULAR,
+                size=size,
+                color=color_hex,
+                text=_xml_text(text),
+            )
+            for text in paragraphs
+        )
+        self._replace_paragraphs_xml(text_frame, paragraphs_xml)
+
+    def _replace_paragraphs_xml(self, text_frame, paragraphs_xml: str):
+        """
+        Replace a text frame's paragraphs with pre-serialized <a:p> XML.
+
+        Parses all paragraphs in one go and swaps them into <a:txBody>.
+        Does nothing when paragraphs_xml is empty, so the text body keeps
+        its required default paragraph.
+
+        Args:
+            text_frame: The text frame to fill
+            paragraphs_xml: Concatenated <a:p> elements (no namespace decls)
+        """
+        if not paragraphs_xml:
+            return
+        new_body = parse_xml(f'<a:txBody xmlns:a="{_A_NS}">{paragraphs_xml}</a:txBody>')
+        txBody = text_frame._txBody
+        for p in txBody.p_lst:
+            txBody.remove(p)
+        txBody.extend(list(new_body))
@@ -14,6 +14,12 @@ Why this module exists:
     "latin" font when you use font.name, but Arabic text needs the
     "cs" (Complex Script) font to be set separately via XML.
 
+Performance contract:
+    The pptx helpers run once per paragraph or run, so they are on the hot
+    path of every deck. They must not compile XPath expressions or build
+    namespace maps per call: element lookups use find() with Clark-notation
+    tags precomputed at module load (_CS_TAG, _LATIN_TAG, _EA_TAG).
+
 Usage:
     from engine.rtl_helpers import (
         pptx_set_paragraph_rtl,
@@ -22,6 +28,8 @@ Usage:
     )
 """
 
+from xml.sax.saxutils import escape, quoteattr
+
 from lxml import etree
 
 # ============================================================================
@@ -31,6 +39,19 @@ from lxml import etree
 # The XML namespace for DrawingML (used in PPTX files)
 _DRAWINGML_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
 
+# Clark-notation tags for the three <a:rPr> font slots
+_CS_TAG = f'{{{_DRAWINGML_NS}}}cs'
+_LATIN_TAG = f'{{{_DRAWINGML_NS}}}latin'
+_EA_TAG = f'{{{_DRAWINGML_NS}}}ea'
+
+# All three font slots in one fragment, in the order the per-slot path
+# appends them; filled in and parsed once per fresh run
+_FONT_SLOTS_XML = (
+    f'<a:rPr xmlns:a="{_DRAWINGML_NS}">'
+    '<a:cs typeface="{font}"/><a:latin typeface="{font}"/>'
+    '<a:ea typeface="{font}"/></a:rPr>'
+)
+
 
 def pptx_set_paragraph_rtl(paragraph):
     """
@@ -97,23 +118,34 @@ def pptx_set_run_font_arabic(run, font_name, language="ar-JO"):
         >>> pptx_set_run_font_arabic(run, "Tajawal ExtraBold")
     """
     rPr = run._r.get_or_add_rPr()
+    find = rPr.find
+
+    # Fresh run: no font slot exists yet, so all three come from a single
+    # parsed fragment instead of three find()/SubElement() round-trips
+    if find(_CS_TAG) is None and find(_LATIN_TAG) is None and find(_EA_TAG) is None:
+        font = escape(font_name, {'"': "&quot;"})
+        rPr.extend(etree.fromstring(_FONT_SLOTS_XML.format(font=font)))
+        rPr.set('lang', language)
+        return
+
+    sub_element = etree.SubElement
 
     # Complex Script font — this is what Arabic text actually uses
-    cs_font = rPr.find(f'{{{_DRAWINGML_NS}}}cs')
+    cs_font = find(_CS_TAG)
     if cs_font is None:
-        cs_font = etree.SubElement(rPr, f'{{{_DRAWINGML_NS}}}cs')
+        cs_font = sub_element(rPr, _CS_TAG)
     cs_font.set('typeface', font_name)
 
     # Latin font — used for any English/ASCII characters in the text
-    latin_font = rPr.find(f'{{{_DRAWINGML_NS}}}latin')
+    latin_font = find(_LATIN_TAG)
     if latin_font is None:
-        latin_font = etree.SubElement(rPr, f'{{{_DRAWINGML_NS}}}latin')
+        latin_font = sub_element(rPr, _LATIN_TAG)
     latin_font.set('typeface', font_name)
 
     # East Asian font — set for completeness
-    ea_font = rPr.find(f'{{{_DRAWINGML_NS}}}ea')
+    ea_font = find(_EA_TAG)
     if ea_font is None:
-        ea_font = etree.SubElement(rPr, f'{{{_DRAWINGML_NS}}}ea')
+        ea_font = sub_element(rPr, _EA_TAG)
     ea_font.set('typeface', font_name)
 
     # Set language tag for proper Arabic text shaping
@@ -126,6 +158,71 @@ def pptx_set_run_font_arabic(run, font_name, language="ar-JO"):
 # These will be used by the DOCX engine (docx_engine.py) once it's built.
 # The template-analyst is building that module.
 
+# python-docx names used by the helpers below, bound on first use by
+# _ensure_docx_imports() so importing this module never needs python-docx
+_OxmlElement = None
+_qn = None
+_W_NSDECLS = None
+_parse_xml = None
+_WD_TABLE_DIRECTION = None
+
+# The WordprocessingML namespace (used in DOCX files)
+_WORDML_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# Clark-notation tags of the <w:pPr> children that schema-order after
+# <w:bidi> — docx_set_paragraph_rtl() inserts it before the first of them
+_BIDI_SUCCESSOR_TAGS = frozenset(
+    f"{{{_WORDML_NS}}}{name}"
+    for name in (
+        "adjustRightInd",
+        "snapToGrid",
+        "spacing",
+        "ind",
+        "contextualSpacing",
+        "mirrorIndents",
+        "suppressOverlap",
+        "jc",
+        "textDirection",
+        "textAlignment",
+        "textboxTightWrap",
+        "outlineLvl",
+        "divId",
+        "cnfStyle",
+        "rPr",
+        "sectPr",
+        "pPrChange",
+    )
+)
+
+
+def _ensure_docx_imports():
+    """
+    Import the python-docx names the docx helpers use, once.
+
+    The helpers run per paragraph, run and table cell, so they look these
+    up as module globals instead of running a from-import on every call.
+    A no-op after the first call.
+    """
+    global _OxmlElement, _qn, _W_NSDECLS, _parse_xml, _WD_TABLE_DIRECTION
+    if _OxmlElement is not None:
+        return
+
+    from docx.oxml import OxmlElement, parse_xml
+    from docx.oxml.ns import nsdecls, qn
+
+    try:
+        from docx.enum.table import WD_TABLE_DIRECTION
+    except ImportError:
+        # Older python-docx — docx_set_table_rtl() falls back to XML
+        WD_TABLE_DIRECTION = None
+
+    _qn = qn
+    _W_NSDECLS = nsdecls("w")
+    _parse_xml = parse_xml
+    _WD_TABLE_DIRECTION = WD_TABLE_DIRECTION
+    _OxmlElement = OxmlElement
+
+
 def docx_set_paragraph_rtl(paragraph):
     """
     Set paragraph direction to RTL in a Word document.
@@ -137,37 +234,20 @@ def docx_set_paragraph_rtl(paragraph):
         paragraph: A python-docx paragraph object
 
     Note:
-        This uses insert_element_before() to place the bidi element
-        in the correct position within the pPr element, as required
-        by the Office Open XML schema ordering rules.
+        The bidi element is inserted before the first child that the
+        Office Open XML schema orders after it (_BIDI_SUCCESSOR_TAGS),
+        or appended if there is none.
     """
-    # Import here to avoid requiring python-docx when only using pptx
-    from docx.oxml.parser import OxmlElement
+    # Bound lazily to avoid requiring python-docx when only using pptx
+    _ensure_docx_imports()
 
     pPr = paragraph._p.get_or_add_pPr()
-    bidi = OxmlElement("w:bidi")
-    pPr.insert_element_before(
-        bidi,
-        *(
-            "w:adjustRightInd",
-            "w:snapToGrid",
-            "w:spacing",
-            "w:ind",
-            "w:contextualSpacing",
-            "w:mirrorIndents",
-            "w:suppressOverlap",
-            "w:jc",
-            "w:textDirection",
-            "w:textAlignment",
-            "w:textboxTightWrap",
-            "w:outlineLvl",
-            "w:divId",
-            "w:cnfStyle",
-            "w:rPr",
-            "w:sectPr",
-            "w:pPrChange",
-        )
-    )
+    bidi = _OxmlElement("w:bidi")
+    for index, child in enumerate(pPr):
+        if child.tag in _BIDI_SUCCESSOR_TAGS:
+            pPr.insert(index, bidi)
+            return
+    pPr.append(bidi)
 
 
 def docx_set_run_rtl(run):
@@ -181,10 +261,10 @@ def docx_set_run_rtl(run):
     Args:
         run: A python-docx Run object
     """
-    from docx.oxml import OxmlElement
+    _ensure_docx_imports()
 
     rPr = run._r.get_or_add_rPr()
-    rtl = OxmlElement('w:rtl')
+    rtl = _OxmlElement('w:rtl')
     rPr.append(rtl)
 
 
@@ -203,18 +283,17 @@ def docx_set_table_rtl(table):
     Args:
         table: A python-docx Table object
     """
-    from docx.oxml import OxmlElement
+    _ensure_docx_imports()
 
     try:
-        from docx.enum.table import WD_TABLE_DIRECTION
-        table.table_direction = WD_TABLE_DIRECTION.RTL
+        table.table_direction = _WD_TABLE_DIRECTION.RTL
     except Exception:
         # Fallback: manipulate XML directly
         tblPr = table._tbl.tblPr
         if tblPr is None:
-            tblPr = OxmlElement('w:tblPr')
+            tblPr = _OxmlElement('w:tblPr')
             table._tbl.insert(0, tblPr)
-        bidiVisual = OxmlElement('w:bidiVisual')
+        bidiVisual = _OxmlElement('w:bidiVisual')
         tblPr.append(bidiVisual)
 
     # Disable autofit so Word respects our explicit column widths
@@ -237,13 +316,15 @@ def docx_set_cell_shading(cell, color_hex):
         >>> docx_set_cell_shading(table.cell(0, 0), "31849B")  # Teal
         >>> docx_set_cell_shading(table.cell(1, 0), "DBE5F1")  # Light blue
     """
-    from docx.oxml.ns import nsdecls
-    from docx.oxml import parse_xml
+    _ensure_docx_imports()
 
     # CRITICAL: Create a NEW element each time — never reuse!
-    shading_elm = parse_xml(
-        f'<w:shd {nsdecls("w")} w:fill="{color_hex}"/>'
-    )
+    # Built directly rather than parsed; val="clear" + color="auto" is the
+    # plain solid fill Word itself writes (w:val is required by the schema)
+    shading_elm = _OxmlElement('w:shd')
+    shading_elm.set(_qn('w:val'), 'clear')
+    shading_elm.set(_qn('w:color'), 'auto')
+    shading_elm.set(_qn('w:fill'), color_hex)
     cell._tc.get_or_add_tcPr().append(shading_elm)
 
 
@@ -271,19 +352,18 @@ def docx_set_cell_borders(cell, **kwargs):
         ...     top={"sz": 18, "val": "single", "color": "FFFFFF"},
         ... )
     """
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
-
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcBorders = OxmlElement('w:tcBorders')
+    _ensure_docx_imports()
 
+    # The whole <w:tcBorders> subtree is serialized and parsed once per
+    # cell rather than built edge by edge, attribute by attribute
+    parts = [f'<w:tcBorders {_W_NSDECLS}>']
     for edge in ('top', 'left', 'bottom', 'right', 'start', 'end'):
         if edge in kwargs:
-            edge_data = kwargs[edge]
-            element = OxmlElement(f'w:{edge}')
-            for attr_name, attr_val in edge_data.items():
-                element.set(qn(f'w:{attr_name}'), str(attr_val))
-            tcBorders.append(element)
-
-    tcPr.append(tcBorders)
+            attrs = "".join(
+                f' w:{attr_name}={quoteattr(str(attr_val))}'
+                for attr_name, attr_val in kwargs[edge].items()
+            )
+            parts.append(f'<w:{edge}{attrs}/>')
+    parts.append('</w:tcBorders>')
+
+    cell._tc.get_or_add_tcPr().append(_parse_xml("".join(parts)))
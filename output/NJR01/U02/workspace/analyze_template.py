@@ -1,54 +1,156 @@
 #!/usr/bin/env python3
-"""Analyze the interactive lecture template."""
-import subprocess, sys, os
-
-SKILLS = "/Users/qusaiabushanap/.claude/plugins/cache/anthropic-agent-skills/document-skills/00756142ab04/skills/pptx"
-TEMPLATE = "/Users/qusaiabushanap/dev/storyboard/templates/قالب المحاضرة التفاعلية- عربي.pptx"
-WORKSPACE = "/Users/qusaiabushanap/dev/storyboard/output/NJR01/U02/workspace"
-
-os.makedirs(WORKSPACE, exist_ok=True)
-os.chdir(SKILLS)
-
-# 1. Extract text with markitdown
-print("=== Step 1: Extracting text ===")
-result = subprocess.run(
-    [sys.executable, "-m", "markitdown", TEMPLATE],
-    capture_output=True, text=True
-)
-with open(f"{WORKSPACE}/template-content.md", "w") as f:
-    f.write(result.stdout)
-print(f"Text extracted: {len(result.stdout)} chars")
-if result.stderr:
-    print(f"Warnings: {result.stderr[:500]}")
-
-# 2. Create thumbnails
-print("\n=== Step 2: Creating thumbnails ===")
-result = subprocess.run(
-    [sys.executable, f"{SKILLS}/scripts/thumbnail.py", TEMPLATE, f"{WORKSPACE}/template-thumbs", "--cols", "4"],
-    capture_output=True, text=True
-)
-print(result.stdout)
-if result.stderr:
-    print(f"Errors: {result.stderr[:500]}")
-
-# 3. Unpack template
-print("\n=== Step 3: Unpacking template ===")
-result = subprocess.run(
-    [sys.executable, f"{SKILLS}/ooxml/scripts/unpack.py", TEMPLATE, f"{WORKSPACE}/template-unpacked"],
-    capture_output=True, text=True
-)
-print(result.stdout)
-if result.stderr:
-    print(f"Errors: {result.stderr[:500]}")
-
-# 4. Run inventory on template
-print("\n=== Step 4: Running inventory ===")
-result = subprocess.run(
-    [sys.executable, f"{SKILLS}/scripts/inventory.py", TEMPLATE, f"{WORKSPACE}/template-inventory.json"],
-    capture_output=True, text=True
-)
-print(result.stdout)
-if result.stderr:
-    print(f"Errors: {result.stderr[:500]}")
-
-print("\n=== Done ===")
+"""Analyze the interactive lecture template.
+
+Stages whose outputs were built from the current template (same mtime and
+size) are skipped; pass --force to re-run everything.
+"""
+import posixpath, subprocess, sys, os, tempfile, zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from lxml import etree
+
+SKILLS = Path("/Users/qusaiabushanap/.claude/plugins/cache/anthropic-agent-skills/document-skills/00756142ab04/skills/pptx")
+TEMPLATE = Path("/Users/qusaiabushanap/dev/storyboard/templates/قالب المحاضرة التفاعلية- عربي.pptx")
+WORKSPACE = Path("/Users/qusaiabushanap/dev/storyboard/output/NJR01/U02/workspace")
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P_SLDID = "{http://schemas.openxmlformats.org/presentationml/2006/main}sldId"
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+
+def template_key():
+    """Cheap identity of the template bytes: mtime plus size."""
+    st = TEMPLATE.stat()
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def write_atomic(path, data):
+    """Write bytes to a sibling temp file, then rename it over path.
+
+    A crash or failure mid-write leaves the previous file (or none) in place,
+    never a truncated one that a later run could mistake for fresh output.
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as f:
+        try:
+            f.write(data)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, path)
+
+
+def is_fresh(stage, key):
+    try:
+        return (WORKSPACE / f".{stage}.cache-key").read_text() == key
+    except FileNotFoundError:
+        return False
+
+
+def mark_fresh(stage, key):
+    write_atomic(WORKSPACE / f".{stage}.cache-key", key.encode())
+
+
+def run_stage(argv):
+    """Run one script; returns (returncode, stdout, first 500 chars of stderr).
+
+    stderr is spooled to an anonymous temp file rather than a pipe, so a
+    chatty child never grows this process's memory for output it won't show.
+    """
+    with tempfile.TemporaryFile() as err:
+        result = subprocess.run(argv, stdout=subprocess.PIPE, stderr=err, encoding="utf-8", errors="replace")
+        err.seek(0)
+        # 4 bytes per char covers any UTF-8 sequence in the 500 shown
+        return result.returncode, result.stdout, err.read(2000).decode("utf-8", "replace")[:500]
+
+
+def extract_text():
+    """Pull the slide text straight out of the template's slide XML.
+
+    Only the <a:t> runs matter for the analysis, so this reads them in one
+    pass per slide instead of going through markitdown's full converter.
+    Slides come out in presentation order, one line per paragraph.
+    """
+    with zipfile.ZipFile(TEMPLATE) as z:
+        rels = etree.fromstring(z.read("ppt/_rels/presentation.xml.rels"))
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels}
+        presentation = etree.fromstring(z.read("ppt/presentation.xml"))
+        slides = []
+        for n, sld_id in enumerate(presentation.iter(_P_SLDID), 1):
+            target = targets[sld_id.get(_R_ID)]
+            name = target.lstrip("/") if target.startswith("/") else posixpath.normpath(f"ppt/{target}")
+            root = etree.fromstring(z.read(name))
+            lines = ["".join(t.text or "" for t in p.iter(f"{_A}t")) for p in root.iter(f"{_A}p")]
+            slides.append(f"<!-- Slide number: {n} -->\n" + "\n".join(line for line in lines if line))
+    return "\n\n".join(slides)
+
+
+def main():
+    force = "--force" in sys.argv[1:]
+    WORKSPACE.mkdir(parents=True, exist_ok=True)
+    # cwd is process-wide — set it before any stage starts
+    os.chdir(SKILLS)
+    key = template_key()
+    failed = []
+
+    # The stages only read TEMPLATE and write disjoint outputs, so they run
+    # side by side (each script thread just waits on its child process)
+    stages = [
+        ("thumbs", "Step 2: Creating thumbnails",
+         [sys.executable, SKILLS / "scripts/thumbnail.py", TEMPLATE, WORKSPACE / "template-thumbs", "--cols", "4"]),
+        ("unpacked", "Step 3: Unpacking template",
+         [sys.executable, SKILLS / "ooxml/scripts/unpack.py", TEMPLATE, WORKSPACE / "template-unpacked"]),
+        ("inventory", "Step 4: Running inventory",
+         [sys.executable, SKILLS / "scripts/inventory.py", TEMPLATE, WORKSPACE / "template-inventory.json"]),
+    ]
+    with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+        # None marks a stage whose output is already up to date
+        futures = [
+            None if not force and is_fresh(stage, key)
+            else executor.submit(run_stage, argv)
+            for stage, _, argv in stages
+        ]
+
+        # 1. Extract the slide text, on this thread meanwhile
+        print("=== Step 1: Extracting text ===")
+        if not force and is_fresh("content", key):
+            print("Template unchanged, skipped")
+        else:
+            try:
+                text = extract_text()
+            except Exception as e:
+                failed.append("Step 1")
+                print(f"Failed: {str(e)[:500]}")
+            else:
+                # Encode once and hand the whole buffer to a single binary write
+                write_atomic(WORKSPACE / "template-content.md", text.encode("utf-8"))
+                mark_fresh("content", key)
+                print(f"Text extracted: {len(text)} chars")
+
+        # Report the scripts in step order as each one finishes; each block
+        # is assembled first and goes out in one write, so it stays contiguous
+        for (stage, label, _), future in zip(stages, futures):
+            block = f"\n=== {label} ===\n"
+            if future is None:
+                block += "Template unchanged, skipped\n"
+            else:
+                returncode, stdout, stderr = future.result()
+                block += f"{stdout}\n"
+                if stderr:
+                    block += f"Errors: {stderr}\n"
+                if returncode == 0:
+                    mark_fresh(stage, key)
+                else:
+                    failed.append(label.split(":")[0])
+                    block += f"Failed with exit code {returncode}\n"
+            sys.stdout.write(block)
+            sys.stdout.flush()
+
+    if failed:
+        sys.exit(f"\n=== Failed: {', '.join(failed)} ===")
+    print("\n=== Done ===")
+
+
+if __name__ == "__main__":
+    main()
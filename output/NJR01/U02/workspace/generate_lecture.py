@@ -7,6 +7,7 @@ Uses python-pptx directly - no external dependencies on skill scripts.
 Usage: python3 generate_lecture.py
 """
 import copy, os
+from lxml import etree
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.enum.text import PP_ALIGN
@@ -17,6 +18,16 @@ TEMPLATE = "/Users/qusaiabushanap/dev/storyboard/templates/قالب المحاض
 OUTPUT = "/Users/qusaiabushanap/dev/storyboard/output/NJR01/U02/NJR01_U02_Interactive_Lecture.pptx"
 os.makedirs(os.path.dirname(OUTPUT), exist_ok=True)
 
+# ── DrawingML tags (Clark notation), built once ──
+A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+PPR_TAG = A_NS + "pPr"
+SPCBEF_TAG = A_NS + "spcBef"
+SPCAFT_TAG = A_NS + "spcAft"
+SPCPTS_TAG = A_NS + "spcPts"
+
+# spTree children other than the group's own nvGrpSpPr/grpSpPr, i.e. the shapes
+_SHAPE_CHILDREN_XPATH = etree.XPath("*[local-name()!='nvGrpSpPr' and local-name()!='grpSpPr']")
+
 # ── Step 1: Analyze template ──
 print("Loading template...")
 prs = Presentation(TEMPLATE)
@@ -77,27 +88,15 @@ def duplicate_slide(prs, template_slide_index):
     # First, remove default placeholder shapes from new slide
     # (they come from the layout)
 
-    # We need to copy the XML content
-    # Get the template slide's XML
-    import lxml.etree as etree
-
     # Clear the new slide's spTree (shape tree)
     new_sp_tree = new_slide.shapes._spTree
     # Remove all existing shapes except the first two (nvGrpSpPr and grpSpPr)
-    children_to_remove = []
-    for child in new_sp_tree:
-        tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-        if tag not in ('nvGrpSpPr', 'grpSpPr'):
-            children_to_remove.append(child)
-    for child in children_to_remove:
+    for child in _SHAPE_CHILDREN_XPATH(new_sp_tree):
         new_sp_tree.remove(child)
 
     # Copy shapes from template
     template_sp_tree = template_slide.shapes._spTree
-    for child in template_sp_tree:
-        tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-        if tag not in ('nvGrpSpPr', 'grpSpPr'):
-            new_sp_tree.append(copy.deepcopy(child))
+    new_sp_tree.extend(copy.deepcopy(child) for child in _SHAPE_CHILDREN_XPATH(template_sp_tree))
 
     # Copy slide background if present
     template_cSld = template_slide._element
@@ -145,6 +144,7 @@ def set_text_in_shape(shape, paragraphs_data):
         p = tf.paragraphs[i]._p
         p.getparent().remove(p)
 
+    SubElement = etree.SubElement  # local alias, looked up once per call
     for idx, pdata in enumerate(paragraphs_data):
         if idx == 0:
             p = tf.paragraphs[0]
@@ -176,24 +176,22 @@ def set_text_in_shape(shape, paragraphs_data):
             font.name = pdata['font_name']
 
         # RTL for Arabic
-        from lxml import etree
-        nsmap = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-        pPr = p._p.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pPr')
+        pPr = p._p.find(PPR_TAG)
         if pPr is None:
-            pPr = etree.SubElement(p._p, '{http://schemas.openxmlformats.org/drawingml/2006/main}pPr')
+            pPr = SubElement(p._p, PPR_TAG)
             # Move pPr to be first child
             p._p.insert(0, pPr)
         pPr.set('rtl', '1')
 
         # Set space before/after if specified
         if 'space_before' in pdata:
-            spc_bef = etree.SubElement(pPr, '{http://schemas.openxmlformats.org/drawingml/2006/main}spcBef')
-            spc_pts = etree.SubElement(spc_bef, '{http://schemas.openxmlformats.org/drawingml/2006/main}spcPts')
+            spc_bef = SubElement(pPr, SPCBEF_TAG)
+            spc_pts = SubElement(spc_bef, SPCPTS_TAG)
             spc_pts.set('val', str(int(pdata['space_before'] * 100)))
 
         if 'space_after' in pdata:
-            spc_aft = etree.SubElement(pPr, '{http://schemas.openxmlformats.org/drawingml/2006/main}spcAft')
-            spc_pts = etree.SubElement(spc_aft, '{http://schemas.openxmlformats.org/drawingml/2006/main}spcPts')
+            spc_aft = SubElement(pPr, SPCAFT_TAG)
+            spc_pts = SubElement(spc_aft, SPCPTS_TAG)
             spc_pts.set('val', str(int(pdata['space_after'] * 100)))
 
 